@@ -14,9 +14,9 @@ Required scopes:
     - gmail.send (send summary emails)
 """
 
-import json
 from pathlib import Path
 
+import orjson
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = [
@@ -60,6 +60,9 @@ def main():
         "client_secret": credentials.client_secret,
     }
 
+    # Serialize once for both the terminal and the local copy
+    payload = orjson.dumps(creds_dict, option=orjson.OPT_INDENT_2)
+
     print("\n" + "=" * 60)
     print("SUCCESS! Copy the following JSON to AWS Secrets Manager")
     print("=" * 60)
@@ -67,13 +70,12 @@ def main():
     print("Secret name: granola-summarizer/credentials")
     print("Add this as the 'gmail_credentials' field:")
     print()
-    print(json.dumps(creds_dict, indent=2))
+    print(payload.decode("utf-8"))
     print()
 
     # Also save locally for testing
     output_path = script_dir / "gmail_credentials.json"
-    with open(output_path, "w") as f:
-        json.dump(creds_dict, f, indent=2)
+    output_path.write_bytes(payload)
 
     print(f"Also saved to: {output_path}")
     print("(Delete this file after copying to Secrets Manager)")
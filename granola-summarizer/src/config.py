@@ -2,12 +2,26 @@
 
 import json
 import os
-from dataclasses import dataclass
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 import boto3
 from botocore.exceptions import ClientError
 
+# Pacific time, including daylight saving
+PST = ZoneInfo("America/Los_Angeles")
+
+# Secrets and config are reused across warm invocations but expire, so
+# rotated secrets reach long-lived containers
+CACHE_TTL_SECONDS = 300
+
+_secret_cache: dict[tuple[str, str], tuple[dict, float]] = {}
+_config_cache: dict[tuple[str, bool], tuple["Config", float]] = {}
+
 
 @dataclass
 class FilterConfig:
@@ -16,6 +30,18 @@ class FilterConfig:
     skip_internal_domains: list[str]
     skip_vc_patterns: list[str]
 
+    # Lookup structures derived once from the raw settings above
+    skip_titles_lower: tuple[str, ...] = field(init=False, repr=False)
+    internal_domains_tuple: tuple[str, ...] = field(init=False, repr=False)
+    vc_patterns_compiled: list[re.Pattern] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.skip_titles_lower = tuple(t.lower() for t in self.skip_titles)
+        self.internal_domains_tuple = tuple(d.lower() for d in self.skip_internal_domains)
+        self.vc_patterns_compiled = [
+            re.compile(p, re.IGNORECASE) for p in self.skip_vc_patterns
+        ]
+
 
 @dataclass
 class Config:
@@ -26,21 +52,55 @@ class Config:
     gmail_credentials: dict
 
 
-def get_secret(secret_name: str, region: str = "us-west-2") -> dict:
-    """Retrieve secret from AWS Secrets Manager."""
-    client = boto3.client("secretsmanager", region_name=region)
+@lru_cache(maxsize=None)
+def _get_secrets_client(region: str):
+    """Get a Secrets Manager client, built once per region per container."""
+    return boto3.client("secretsmanager", region_name=region)
+
+
+def _get_cached(cache: dict, key):
+    """Return a cached value if it is younger than CACHE_TTL_SECONDS."""
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() - entry[1] < CACHE_TTL_SECONDS:
+        return entry[0]
+    return None
+
+
+def get_secret(secret_name: str, region: Optional[str] = None) -> dict:
+    """
+    Retrieve secret from AWS Secrets Manager.
+
+    Results are cached for CACHE_TTL_SECONDS.
+
+    Args:
+        secret_name: Secret ID.
+        region: AWS region. Defaults to AWS_REGION, else us-west-2.
+    """
+    if region is None:
+        region = os.environ.get("AWS_REGION", "us-west-2")
+
+    cached = _get_cached(_secret_cache, (secret_name, region))
+    if cached is not None:
+        return cached
+
+    client = _get_secrets_client(region)
 
     try:
         response = client.get_secret_value(SecretId=secret_name)
-        return json.loads(response["SecretString"])
+        secret = json.loads(response["SecretString"])
     except ClientError as e:
         raise RuntimeError(f"Failed to retrieve secret {secret_name}: {e}")
 
+    _secret_cache[(secret_name, region)] = (secret, time.monotonic())
+    return secret
+
 
 def load_config(config_path: Optional[str] = None, use_local: bool = False) -> Config:
     """
     Load configuration from settings.json and secrets.
 
+    Results are cached for CACHE_TTL_SECONDS per (config_path, use_local).
+
     Args:
         config_path: Path to settings.json. Defaults to config/settings.json.
         use_local: If True, load secrets from environment variables instead of AWS.
@@ -49,6 +109,10 @@ def load_config(config_path: Optional[str] = None, use_local: bool = False) -> C
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         config_path = os.path.join(base_dir, "config", "settings.json")
 
+    cached = _get_cached(_config_cache, (config_path, use_local))
+    if cached is not None:
+        return cached
+
     with open(config_path) as f:
         settings = json.load(f)
 
@@ -67,9 +131,12 @@ def load_config(config_path: Optional[str] = None, use_local: bool = False) -> C
         anthropic_api_key = secrets.get("anthropic_api_key", "")
         gmail_credentials = secrets.get("gmail_credentials", {})
 
-    return Config(
+    config = Config(
         destination_emails=settings.get("destination_emails", []),
         filters=filters,
         anthropic_api_key=anthropic_api_key,
         gmail_credentials=gmail_credentials,
     )
+
+    _config_cache[(config_path, use_local)] = (config, time.monotonic())
+    return config
@@ -3,42 +3,150 @@
 import json
 import logging
 import os
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+from typing import Optional
 
-from .config import load_config
+from .config import PST, Config, load_config
 from .gmail_client import GmailClient
-from .storage import get_meetings_for_date, delete_meetings_for_date
-from .summarizer import summarize_all_meetings, format_digest_email
+from .storage import (
+    delete_digest_batch,
+    delete_meetings_for_date,
+    get_meetings_for_date,
+    get_pending_digest_batches,
+    mark_digest_batch_failed,
+    store_digest_batch,
+)
+from .summarizer import (
+    collect_digest_batch,
+    format_digest_email,
+    submit_digest_batch,
+    summarize_all_meetings,
+)
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Container-scoped singletons, reused across warm invocations
+_GMAIL: Optional[GmailClient] = None
+_GMAIL_CREDENTIALS: Optional[dict] = None
+
+
+def _get_config() -> Config:
+    """Load configuration (cached with a TTL by load_config)."""
+    use_local = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
+    return load_config(use_local=use_local)
+
+
+def _get_gmail_client(config: Config) -> GmailClient:
+    """
+    Build the Gmail client (and its discovery service) once per container.
+
+    The client is rebuilt when the config's Gmail credentials change, so
+    rotated secrets take effect once the config cache refreshes.
+    """
+    global _GMAIL, _GMAIL_CREDENTIALS
+    if _GMAIL is None or config.gmail_credentials != _GMAIL_CREDENTIALS:
+        _GMAIL = GmailClient(config.gmail_credentials)
+        _GMAIL_CREDENTIALS = config.gmail_credentials
+    return _GMAIL
+
+
+# Initialize during the Lambda INIT phase; fall back to lazy init on failure
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    try:
+        _get_gmail_client(_get_config())
+    except Exception as e:
+        logger.warning(f"Deferring client initialization: {e}")
+
+
+def _use_batch_api() -> bool:
+    """Whether digests go through the Message Batches API (see poll_handler)."""
+    return os.environ.get("USE_BATCH_API", "false").lower() == "true"
+
+
+def _send_digest(
+    config: Config,
+    date: str,
+    date_formatted: str,
+    meetings: list[dict],
+    email_html: str,
+) -> dict:
+    """
+    Send a digest email to all recipients and clean up its meetings.
+
+    Args:
+        config: Application configuration.
+        date: Digest date in YYYY-MM-DD format.
+        date_formatted: Digest date as shown in the subject line.
+        meetings: Meetings included in the digest (deleted once sent).
+        email_html: Complete HTML email body.
+
+    Returns:
+        Response dictionary with statusCode and body.
+    """
+    subject = f"Daily Meeting Digest - {date_formatted}"
+
+    # Send to all configured recipients in a single batch request
+    logger.info(f"Sending digest to {config.destination_emails}")
+    results = _get_gmail_client(config).send_email_batch(
+        recipients=config.destination_emails,
+        subject=subject,
+        body_html=email_html,
+    )
+    successful_sends = [email for email, ok in results.items() if ok]
+    failed_sends = [email for email, ok in results.items() if not ok]
+
+    if successful_sends:
+        logger.info(f"Successfully sent daily digest to {successful_sends}")
+
+        # Clean up processed meetings (only if there were any)
+        if meetings:
+            deleted = delete_meetings_for_date(date, meetings=meetings)
+            logger.info(f"Cleaned up {deleted} meetings from DynamoDB")
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "message": "Daily digest sent successfully",
+                "meetings_count": len(meetings),
+                "date": date,
+                "destinations": successful_sends,
+                "failed": failed_sends,
+            }),
+        }
+    else:
+        logger.error("Failed to send email to any recipient")
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": "Failed to send email to any recipient"}),
+        }
+
 
 def lambda_handler(event: dict, context) -> dict:
     """
     AWS Lambda entry point for daily digest.
     Reads all meetings from DynamoDB, summarizes them, sends one email.
+
+    With USE_BATCH_API=true, the summary is submitted to the Message Batches
+    API instead and poll_handler sends the email once it completes.
     """
     logger.info("Starting daily meeting digest")
 
     try:
         # Load configuration
-        use_local = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
-        config = load_config(use_local=use_local)
+        config = _get_config()
 
         # Get today's date in PST
-        pst = timezone(timedelta(hours=-8))
-        today = datetime.now(pst).strftime("%Y-%m-%d")
+        now_pst = datetime.now(PST)
+        today = now_pst.strftime("%Y-%m-%d")
 
         logger.info(f"Fetching meetings for {today}")
 
         # Get all meetings for today
         meetings = get_meetings_for_date(today)
 
-        gmail_client = GmailClient(config.gmail_credentials)
-        today_formatted = datetime.strptime(today, "%Y-%m-%d").strftime("%B %d, %Y")
-        subject = f"Daily Meeting Digest - {today_formatted}"
+        today_formatted = now_pst.strftime("%B %d, %Y")
 
         if not meetings:
             logger.info("No meetings to summarize today - sending notification email")
@@ -53,70 +161,58 @@ def lambda_handler(event: dict, context) -> dict:
             </body>
             </html>
             """
-        else:
-            logger.info(f"Found {len(meetings)} meetings to summarize")
+            return _send_digest(config, today, today_formatted, meetings, email_html)
+
+        logger.info(f"Found {len(meetings)} meetings to summarize")
 
-            # Summarize all meetings
-            summary = summarize_all_meetings(
+        if _use_batch_api():
+            batch_id = submit_digest_batch(
                 meetings=meetings,
                 api_key=config.anthropic_api_key,
             )
 
-            if not summary:
-                logger.error("Failed to generate summary")
+            if not batch_id:
+                logger.error("Failed to submit digest batch")
                 return {
                     "statusCode": 500,
-                    "body": json.dumps({"error": "Failed to generate summary"}),
+                    "body": json.dumps({"error": "Failed to submit digest batch"}),
                 }
 
-            # Format email with meeting summaries
-            email_html = format_digest_email(
-                meetings=meetings,
-                summary=summary,
-                date=today,
-            )
-
-        # Send to all configured recipients
-        successful_sends = []
-        failed_sends = []
-
-        for email in config.destination_emails:
-            logger.info(f"Sending digest to {email}")
-            success = gmail_client.send_email(
-                to=email,
-                subject=subject,
-                body_html=email_html,
-            )
-            if success:
-                successful_sends.append(email)
-            else:
-                failed_sends.append(email)
-
-        if successful_sends:
-            logger.info(f"Successfully sent daily digest to {successful_sends}")
-
-            # Clean up processed meetings (only if there were any)
-            if meetings:
-                deleted = delete_meetings_for_date(today)
-                logger.info(f"Cleaned up {deleted} meetings from DynamoDB")
+            store_digest_batch(today, batch_id, [m["meeting_id"] for m in meetings])
+            logger.info(f"Submitted digest batch {batch_id}")
 
             return {
-                "statusCode": 200,
+                "statusCode": 202,
                 "body": json.dumps({
-                    "message": "Daily digest sent successfully",
+                    "message": "Daily digest batch submitted",
                     "meetings_count": len(meetings),
                     "date": today,
-                    "destinations": successful_sends,
-                    "failed": failed_sends,
+                    "batch_id": batch_id,
                 }),
             }
-        else:
-            logger.error("Failed to send email to any recipient")
+
+        # Summarize all meetings
+        summary = summarize_all_meetings(
+            meetings=meetings,
+            api_key=config.anthropic_api_key,
+        )
+
+        if not summary:
+            logger.error("Failed to generate summary")
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": "Failed to send email to any recipient"}),
+                "body": json.dumps({"error": "Failed to generate summary"}),
             }
 
+        # Format email with meeting summaries
+        email_html = format_digest_email(
+            meetings=meetings,
+            summary=summary,
+            date=today,
+        )
+
+        return _send_digest(config, today, today_formatted, meetings, email_html)
+
     except Exception as e:
         logger.exception(f"Error in digest handler: {e}")
         return {
@@ -125,6 +221,105 @@ def lambda_handler(event: dict, context) -> dict:
         }
 
 
+def _deliver_digest_batch(config: Config, record: dict) -> bool:
+    """
+    Send the digest for one pending batch record if its batch has finished.
+
+    A batch whose requests failed or expired falls back to summarizing
+    directly; if that fails too, the record is marked failed so later
+    polls skip it. poll_handler does the same for records that raise.
+
+    Args:
+        config: Application configuration.
+        record: Pending digest batch record from storage.
+
+    Returns:
+        True if the digest was sent and the record removed.
+    """
+    date = record["date"]
+    batch_id = record["batch_id"]
+
+    finished, summary = collect_digest_batch(batch_id, config.anthropic_api_key)
+    if not finished:
+        logger.info(f"Digest batch {batch_id} for {date} still processing")
+        return False
+
+    # Only meetings submitted with the batch were summarized
+    meeting_ids = set(record.get("meeting_ids", []))
+    meetings = [
+        m for m in get_meetings_for_date(date)
+        if m["meeting_id"] in meeting_ids
+    ]
+
+    if not summary:
+        logger.warning(f"Digest batch {batch_id} failed, summarizing directly")
+        summary = summarize_all_meetings(
+            meetings=meetings,
+            api_key=config.anthropic_api_key,
+        )
+
+    if not summary:
+        logger.error(f"Failed to generate summary for batch {batch_id} ({date})")
+        mark_digest_batch_failed(date, "Failed to generate summary")
+        return False
+
+    email_html = format_digest_email(
+        meetings=meetings,
+        summary=summary,
+        date=date,
+    )
+
+    date_formatted = datetime.strptime(date, "%Y-%m-%d").strftime("%B %d, %Y")
+    result = _send_digest(config, date, date_formatted, meetings, email_html)
+    if result["statusCode"] != 200:
+        return False
+
+    delete_digest_batch(date)
+    return True
+
+
+def poll_handler(event: dict, context) -> dict:
+    """
+    AWS Lambda entry point for collecting batched digests.
+    Runs on a schedule; sends each digest whose batch has finished.
+    """
+    logger.info("Polling pending digest batches")
+
+    try:
+        config = _get_config()
+        delivered = []
+        failed = []
+
+        for record in get_pending_digest_batches():
+            date = record["date"]
+            batch_id = record["batch_id"]
+
+            # One bad record must not stop the remaining digests going out
+            try:
+                if _deliver_digest_batch(config, record):
+                    delivered.append(date)
+            except Exception as e:
+                logger.exception(f"Error delivering digest batch {batch_id} for {date}: {e}")
+                mark_digest_batch_failed(date, str(e))
+                failed.append(date)
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "message": "Digest batches polled",
+                "delivered": delivered,
+                "failed": failed,
+            }),
+        }
+
+    except Exception as e:
+        logger.exception(f"Error in digest poll handler: {e}")
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": str(e)}),
+        }
+
+
 def main():
     """Entry point for local testing."""
     os.environ["USE_LOCAL_CONFIG"] = "true"
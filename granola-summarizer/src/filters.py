@@ -1,10 +1,32 @@
 """Meeting filter logic for granola summarizer."""
 
 import re
-from typing import Optional
+from typing import Optional, Union
 
 from .config import FilterConfig
 
+# Matches the address in "Name <email@domain.com>" or "email@domain.com".
+# ASCII-only classes avoid Unicode category lookups.
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w.-]+\.\w+', re.ASCII)
+
+# Comma separator with surrounding whitespace, trimmed in one pass
+_ATTENDEE_SEP = re.compile(r"\s*,\s*")
+
+
+def parse_attendees(attendees: Union[str, list[str]]) -> list[str]:
+    """
+    Normalize the webhook attendees field to a list.
+
+    Args:
+        attendees: List of attendees, or a comma-separated string of them.
+
+    Returns:
+        List of non-empty attendee strings.
+    """
+    if isinstance(attendees, str):
+        return list(filter(None, _ATTENDEE_SEP.split(attendees.strip())))
+    return attendees
+
 
 def should_skip_meeting(
     title: str,
@@ -23,64 +45,50 @@ def should_skip_meeting(
         Tuple of (should_skip, reason).
     """
     # Check title-based filters
-    for skip_title in filters.skip_titles:
-        if skip_title.lower() in title.lower():
+    title_lower = title.lower()
+    for skip_title, skip_title_lower in zip(filters.skip_titles, filters.skip_titles_lower):
+        if skip_title_lower in title_lower:
             return True, f"Title matches skip pattern: {skip_title}"
 
+    # Parse each attendee once for both attendee checks
+    emails = [email for email in map(_extract_email, attendees) if email]
+
     # Check if all attendees are internal (all @1984.vc)
-    if attendees and _all_internal(attendees, filters.skip_internal_domains):
+    if _all_internal(emails, filters.internal_domains_tuple):
         return True, "All attendees are internal"
 
     # Check if meeting is with VCs
-    if attendees and _is_vc_meeting(attendees, filters.skip_vc_patterns):
+    if _is_vc_meeting(emails, filters.vc_patterns_compiled):
         return True, "Meeting appears to be with VCs"
 
     return False, None
 
 
-def _all_internal(attendees: list[str], internal_domains: list[str]) -> bool:
-    """Check if all attendees are from internal domains."""
-    if not attendees:
-        return False
-
-    # Track if we found any external emails
-    found_any_email = False
-
-    for attendee in attendees:
-        email = _extract_email(attendee)
-        if not email:
-            continue
-
-        found_any_email = True
-        is_internal = False
-        for domain in internal_domains:
-            if email.endswith(domain):
-                is_internal = True
-                break
-
-        if not is_internal:
-            return False
-
+def _all_internal(emails: list[str], internal_domains: tuple[str, ...]) -> bool:
+    """Check if all attendee emails are from internal domains."""
     # If no emails were found, don't treat as internal (allow the meeting)
-    return found_any_email
+    if not emails:
+        return False
 
+    return all(email.endswith(internal_domains) for email in emails)
 
-def _is_vc_meeting(attendees: list[str], vc_patterns: list[str]) -> bool:
-    """Check if any attendee matches VC domain patterns."""
-    for attendee in attendees:
-        email = _extract_email(attendee)
-        if not email:
-            continue
 
-        for pattern in vc_patterns:
-            if re.search(pattern, email, re.IGNORECASE):
-                return True
+def _is_vc_meeting(emails: list[str], vc_patterns: list[re.Pattern]) -> bool:
+    """Check if any attendee email matches VC domain patterns."""
+    for email in emails:
+        if any(pattern.search(email) for pattern in vc_patterns):
+            return True
 
     return False
 
 
 def _extract_email(attendee: str) -> Optional[str]:
     """Extract email address from attendee string."""
-    # Handle formats like "Name <email@domain.com>" or just "email@domain.com"
-    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', attendee)
+    # Handle formats like "Name <email@domain.com>" or just "email@domain.com".
+    # Bare addresses are the common case and need no regex at all.
+    attendee = attendee.strip()
+    if "@" in attendee and "<" not in attendee and " " not in attendee:
+        return attendee.lower()
+
+    match = _EMAIL_RE.search(attendee)
     return match.group(0).lower() if match else None
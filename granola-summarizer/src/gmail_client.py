@@ -1,14 +1,66 @@
 """Gmail API client for sending emails."""
 
 import base64
-import re
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from html.parser import HTMLParser
 from typing import Optional
 
-from bs4 import BeautifulSoup
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# execute() retries 429 and 5xx responses with randomized exponential backoff
+_NUM_RETRIES = 4
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Base64 lines never start with "--", so a fixed boundary cannot collide
+_BOUNDARY = b"=_granola_alternative"
+
+
+def _encode_header(value: str) -> bytes:
+    """Encode a header value, using RFC 2047 for non-ASCII text."""
+    # Fold any line breaks so the value cannot inject extra headers
+    value = " ".join(value.splitlines())
+    if value.isascii():
+        return value.encode("ascii")
+    return Header(value, "utf-8").encode(linesep="\r\n").encode("ascii")
+
+
+def _mime_part(content_type: str, body: str) -> bytes:
+    """Build one base64-encoded UTF-8 part of a multipart message."""
+    return b"".join((
+        b"--", _BOUNDARY, b"\r\n",
+        b"Content-Type: ", content_type.encode("ascii"), b'; charset="utf-8"\r\n',
+        b"Content-Transfer-Encoding: base64\r\n",
+        b"\r\n",
+        base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n"),
+    ))
+
+
+class _TextExtractor(HTMLParser):
+    """Collect text nodes from HTML, skipping non-content elements."""
+
+    _SKIP_TAGS = {"script", "style", "head"}
+
+    def __init__(self):
+        super().__init__()
+        self.chunks: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.chunks.append(data)
 
 
 class GmailClient:
@@ -37,23 +89,46 @@ class GmailClient:
 
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove script and style elements
-        for element in soup(["script", "style", "head", "meta"]):
-            element.decompose()
-
-        # Get text and clean up whitespace
-        text = soup.get_text(separator="\n")
+        # Collect text, dropping script, style and head elements
+        parser = _TextExtractor()
+        parser.feed(html)
+        parser.close()
+        text = "\n".join(parser.chunks)
 
-        # Clean up excessive whitespace
+        # Clean up excessive whitespace; dropping blank lines also means
+        # runs of newlines cannot survive
         lines = [line.strip() for line in text.splitlines()]
-        text = "\n".join(line for line in lines if line)
+        return "\n".join(line for line in lines if line)
 
-        # Remove excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+    def _build_message_bytes(
+        self,
+        subject: str,
+        body_html: str,
+        body_text: str,
+    ) -> bytes:
+        """
+        Build a multipart/alternative message without a To header.
 
-        return text
+        The result is shared by every recipient of the same email; see
+        _encode_for_recipient.
+        """
+        # Assembled by hand; the fixed shape doesn't need the email package's
+        # generator and header folding machinery
+        return b"".join((
+            b"Subject: ", _encode_header(subject), b"\r\n",
+            b"MIME-Version: 1.0\r\n",
+            b'Content-Type: multipart/alternative; boundary="', _BOUNDARY, b'"\r\n',
+            b"\r\n",
+            _mime_part("text/plain", body_text),
+            _mime_part("text/html", body_html),
+            b"--", _BOUNDARY, b"--\r\n",
+        ))
+
+    def _encode_for_recipient(self, to: str, message_bytes: bytes) -> str:
+        """Prepend the To header and base64url-encode for the Gmail API."""
+        return base64.urlsafe_b64encode(
+            b"To: " + _encode_header(to) + b"\r\n" + message_bytes
+        ).decode("ascii")
 
     def send_email(
         self,
@@ -74,31 +149,114 @@ class GmailClient:
         Returns:
             True if sent successfully, False otherwise.
         """
-        message = MIMEMultipart("alternative")
-        message["to"] = to
-        message["subject"] = subject
-
         # Add plain text version
         if body_text is None:
             body_text = self._html_to_text(body_html)
 
-        part1 = MIMEText(body_text, "plain")
-        part2 = MIMEText(body_html, "html")
-
-        message.attach(part1)
-        message.attach(part2)
-
-        # Encode the message
-        raw_message = base64.urlsafe_b64encode(
-            message.as_bytes()
-        ).decode("utf-8")
+        message_bytes = self._build_message_bytes(subject, body_html, body_text)
+        raw_message = self._encode_for_recipient(to, message_bytes)
 
         try:
             self.service.users().messages().send(
                 userId="me",
                 body={"raw": raw_message},
-            ).execute()
+            ).execute(num_retries=_NUM_RETRIES)
             return True
         except Exception as e:
             print(f"Error sending email: {e}")
             return False
+
+    def send_email_batch(
+        self,
+        recipients: list[str],
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+    ) -> dict[str, bool]:
+        """
+        Send the same email to several recipients in one batch HTTP request.
+
+        Args:
+            recipients: Recipient email addresses (at most 100 per batch).
+            subject: Email subject.
+            body_html: HTML body content.
+            body_text: Plain text body (optional, derived from HTML if not provided).
+
+        Returns:
+            Mapping of recipient to whether the send succeeded.
+        """
+        recipients = list(dict.fromkeys(recipients))
+        if not recipients:
+            return {}
+
+        # Derive the plain text version once for all recipients
+        if body_text is None:
+            body_text = self._html_to_text(body_html)
+
+        results = {}
+
+        def _callback(request_id, response, exception):
+            # Leave transient failures unrecorded so they are resent below
+            if isinstance(exception, HttpError) and exception.resp.status in _RETRYABLE_STATUSES:
+                return
+            if exception is not None:
+                print(f"Error sending email to {request_id}: {exception}")
+            results[request_id] = exception is None
+
+        # Build the MIME body once; only the To header differs per recipient
+        message_bytes = self._build_message_bytes(subject, body_html, body_text)
+        raw_messages = {
+            to: self._encode_for_recipient(to, message_bytes)
+            for to in recipients
+        }
+
+        batch = self.service.new_batch_http_request(callback=_callback)
+        for to, raw_message in raw_messages.items():
+            batch.add(
+                self.service.users().messages().send(
+                    userId="me",
+                    body={"raw": raw_message},
+                ),
+                request_id=to,
+            )
+
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"Error sending email batch, falling back to parallel sends: {e}")
+
+        # Resend whatever the batch didn't settle: throttled or 5xx sub-requests,
+        # or every message if the batch request itself failed
+        pending = {to: raw for to, raw in raw_messages.items() if to not in results}
+        results.update(self._send_parallel(pending))
+
+        return {to: results.get(to, False) for to in recipients}
+
+    def _send_parallel(self, raw_messages: dict[str, str]) -> dict[str, bool]:
+        """
+        Send pre-built messages concurrently, one request per recipient.
+
+        Args:
+            raw_messages: Mapping of recipient to base64url-encoded message.
+
+        Returns:
+            Mapping of recipient to whether the send succeeded.
+        """
+        if not raw_messages:
+            return {}
+
+        def _send(to: str) -> tuple[str, bool]:
+            # httplib2 connections are not thread-safe, so each send gets its own
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            try:
+                self.service.users().messages().send(
+                    userId="me",
+                    body={"raw": raw_messages[to]},
+                ).execute(http=http, num_retries=_NUM_RETRIES)
+                return to, True
+            except Exception as e:
+                print(f"Error sending email to {to}: {e}")
+                return to, False
+
+        with ThreadPoolExecutor(max_workers=min(10, len(raw_messages))) as executor:
+            return dict(executor.map(_send, raw_messages))
@@ -4,16 +4,55 @@ import json
 import logging
 import os
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
-from .config import load_config
-from .filters import should_skip_meeting
-from .gmail_client import GmailClient
+import orjson
+
+from .config import Config, load_config
+from .filters import parse_attendees, should_skip_meeting
 from .summarizer import summarize_meeting, format_summary_email
 
+if TYPE_CHECKING:
+    from .gmail_client import GmailClient
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Container-scoped singletons, reused across warm invocations
+_GMAIL: Optional["GmailClient"] = None
+_GMAIL_CREDENTIALS: Optional[dict] = None
+
+
+def _get_config() -> Config:
+    """Load configuration (cached with a TTL by load_config)."""
+    use_local = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
+    return load_config(use_local=use_local)
+
+
+def _get_gmail_client(config: Config) -> "GmailClient":
+    """
+    Build the Gmail client (and its discovery service) once per container.
+
+    The client is rebuilt when the config's Gmail credentials change, so
+    rotated secrets take effect once the config cache refreshes.
+    """
+    global _GMAIL, _GMAIL_CREDENTIALS
+    if _GMAIL is None or config.gmail_credentials != _GMAIL_CREDENTIALS:
+        # Imported lazily so filtered-out meetings never load the Google libraries
+        from .gmail_client import GmailClient
+        _GMAIL = GmailClient(config.gmail_credentials)
+        _GMAIL_CREDENTIALS = config.gmail_credentials
+    return _GMAIL
+
+
+# Load config during the Lambda INIT phase; fall back to lazy init on failure
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    try:
+        _get_config()
+    except Exception as e:
+        logger.warning(f"Deferring client initialization: {e}")
+
 
 def lambda_handler(event: dict, context) -> dict:
     """
@@ -44,7 +83,10 @@ def lambda_handler(event: dict, context) -> dict:
         else:
             payload = body
 
-        logger.info(f"Payload: {json.dumps(payload, default=str)[:500]}")
+        # Payloads can carry long transcripts; only serialize when INFO is on
+        if logger.isEnabledFor(logging.INFO):
+            preview = orjson.dumps(payload, default=str)[:500]
+            logger.info("Payload: %s", preview.decode("utf-8", errors="replace"))
 
         # Extract meeting data
         title = payload.get("title", "Untitled Meeting")
@@ -53,15 +95,13 @@ def lambda_handler(event: dict, context) -> dict:
         transcript = payload.get("transcript")
 
         # Handle attendees as string or list
-        if isinstance(attendees, str):
-            attendees = [a.strip() for a in attendees.split(",") if a.strip()]
+        attendees = parse_attendees(attendees)
 
         logger.info(f"Meeting: {title}")
         logger.info(f"Attendees: {attendees}")
 
         # Load configuration
-        use_local = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
-        config = load_config(use_local=use_local)
+        config = _get_config()
 
         # Apply filters
         should_skip, reason = should_skip_meeting(title, attendees, config.filters)
@@ -95,31 +135,34 @@ def lambda_handler(event: dict, context) -> dict:
             }
 
         # Format and send email
-        logger.info(f"Sending summary to {config.destination_email}")
+        logger.info(f"Sending summary to {config.destination_emails}")
         email_html = format_summary_email(
             title=title,
             attendees=attendees,
             summary=summary,
         )
 
-        gmail_client = GmailClient(config.gmail_credentials)
+        gmail_client = _get_gmail_client(config)
         today = datetime.now().strftime("%B %d")
         subject = f"Meeting Summary: {title} ({today})"
 
-        success = gmail_client.send_email(
-            to=config.destination_email,
+        results = gmail_client.send_email_batch(
+            recipients=config.destination_emails,
             subject=subject,
             body_html=email_html,
         )
+        successful_sends = [email for email, ok in results.items() if ok]
+        failed_sends = [email for email, ok in results.items() if not ok]
 
-        if success:
+        if successful_sends:
             logger.info("Successfully sent meeting summary email")
             return {
                 "statusCode": 200,
                 "body": json.dumps({
                     "message": "Meeting summary sent successfully",
                     "title": title,
-                    "destination": config.destination_email,
+                    "destinations": successful_sends,
+                    "failed": failed_sends,
                 }),
             }
         else:
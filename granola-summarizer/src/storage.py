@@ -2,18 +2,79 @@
 
 import os
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 import boto3
-from boto3.dynamodb.conditions import Key
+import zstandard
+from boto3.dynamodb.conditions import Attr, Key
 
+from .config import PST
 
+# Transcripts are stored zstd-compressed, which keeps long meetings well under
+# DynamoDB's 400KB item limit and cuts read capacity on the digest query
+_TRANSCRIPT_CODEC = "zstd"
+_COMPRESSOR = zstandard.ZstdCompressor(level=10)
+_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+
+@lru_cache(maxsize=None)
+def _get_dynamodb():
+    """Get the DynamoDB service resource, created once per container."""
+    return boto3.resource("dynamodb")
+
+
+@lru_cache(maxsize=None)
 def get_table():
-    """Get DynamoDB table resource."""
-    dynamodb = boto3.resource("dynamodb")
+    """Get DynamoDB table resource, created once per container."""
     table_name = os.environ.get("MEETINGS_TABLE", "granola-meetings")
-    return dynamodb.Table(table_name)
+    return _get_dynamodb().Table(table_name)
+
+
+@lru_cache(maxsize=None)
+def get_batches_table():
+    """Get the DynamoDB table tracking submitted digest batches."""
+    table_name = os.environ.get("DIGEST_BATCHES_TABLE", "granola-digest-batches")
+    return _get_dynamodb().Table(table_name)
+
+
+@lru_cache(maxsize=None)
+def get_summary_cache_table():
+    """Get the DynamoDB table caching Claude responses, if one is configured."""
+    table_name = os.environ.get("SUMMARY_CACHE_TABLE")
+    if not table_name:
+        return None
+    return _get_dynamodb().Table(table_name)
+
+
+# Load the DynamoDB service model during the Lambda INIT phase
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_table()
+
+
+def _query_all(table, **kwargs) -> list[dict]:
+    """Run a query, following LastEvaluatedKey past DynamoDB's 1MB page limit."""
+    return _collect_pages(table.query, **kwargs)
+
+
+def _collect_pages(operation, **kwargs) -> list[dict]:
+    """Call a query or scan operation until LastEvaluatedKey is exhausted."""
+    items = []
+    while True:
+        response = operation(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _decode_meeting(item: dict) -> dict:
+    """Decompress a stored transcript in place, leaving older items as-is."""
+    if item.pop("transcript_codec", None) == _TRANSCRIPT_CODEC:
+        blob = item["transcript"].value
+        item["transcript"] = _DECOMPRESSOR.decompress(blob).decode("utf-8")
+    return item
 
 
 def store_meeting(
@@ -37,30 +98,32 @@ def store_meeting(
         The meeting_id.
     """
     table = get_table()
+    now = datetime.now(timezone.utc)
 
     if date is None:
         # Use PST timezone for date
-        from datetime import timezone
-        pst = timezone(timedelta(hours=-8))
-        date = datetime.now(pst).strftime("%Y-%m-%d")
+        date = now.astimezone(PST).strftime("%Y-%m-%d")
 
-    meeting_id = str(uuid.uuid4())
+    meeting_id = uuid.uuid4().hex
 
     # TTL: expire after 7 days
-    ttl = int((datetime.now() + timedelta(days=7)).timestamp())
+    ttl = int((now + timedelta(days=7)).timestamp())
 
     item = {
         "date": date,
         "meeting_id": meeting_id,
         "title": title,
         "attendees": attendees,
+        # Joined once here instead of on every digest prompt build
+        "attendees_display": ", ".join(attendees) or "Not specified",
         "notes": notes,
-        "created_at": datetime.now().isoformat(),
+        "created_at": now.isoformat(),
         "ttl": ttl,
     }
 
     if transcript:
-        item["transcript"] = transcript
+        item["transcript"] = _COMPRESSOR.compress(transcript.encode("utf-8"))
+        item["transcript_codec"] = _TRANSCRIPT_CODEC
 
     table.put_item(Item=item)
 
@@ -80,15 +143,38 @@ def get_meetings_for_date(date: Optional[str] = None) -> list[dict]:
     table = get_table()
 
     if date is None:
-        from datetime import timezone
-        pst = timezone(timedelta(hours=-8))
-        date = datetime.now(pst).strftime("%Y-%m-%d")
+        date = datetime.now(PST).strftime("%Y-%m-%d")
+
+    items = _query_all(
+        table,
+        KeyConditionExpression=Key("date").eq(date),
+    )
+
+    return [_decode_meeting(item) for item in items]
+
+
+def get_meeting_ids_for_date(date: str) -> list[str]:
+    """
+    Get the IDs of all meetings for a specific date.
+
+    Only the meeting_id attribute is read, so notes and transcripts are not
+    transferred.
+
+    Args:
+        date: Date in YYYY-MM-DD format.
 
-    response = table.query(
-        KeyConditionExpression=Key("date").eq(date)
+    Returns:
+        List of meeting IDs.
+    """
+    table = get_table()
+
+    items = _query_all(
+        table,
+        KeyConditionExpression=Key("date").eq(date),
+        ProjectionExpression="meeting_id",
     )
 
-    return response.get("Items", [])
+    return [item["meeting_id"] for item in items]
 
 
 def delete_meeting(date: str, meeting_id: str) -> None:
@@ -102,19 +188,124 @@ def delete_meeting(date: str, meeting_id: str) -> None:
     )
 
 
-def delete_meetings_for_date(date: str) -> int:
+def delete_meetings_for_date(
+    date: str,
+    meetings: Optional[list[dict]] = None,
+) -> int:
     """
     Delete all meetings for a specific date.
 
     Args:
         date: Date in YYYY-MM-DD format.
+        meetings: Meetings already read for this date. If provided, only these
+            are deleted and no query is issued.
 
     Returns:
         Number of meetings deleted.
     """
-    meetings = get_meetings_for_date(date)
+    if meetings is None:
+        meeting_ids = get_meeting_ids_for_date(date)
+    else:
+        meeting_ids = [meeting["meeting_id"] for meeting in meetings]
+
+    # batch_writer chunks deletes into 25-item BatchWriteItem requests
+    # and retries unprocessed items
+    with get_table().batch_writer() as batch:
+        for meeting_id in meeting_ids:
+            batch.delete_item(
+                Key={
+                    "date": date,
+                    "meeting_id": meeting_id,
+                }
+            )
+
+    return len(meeting_ids)
+
+
+def store_digest_batch(date: str, batch_id: str, meeting_ids: list[str]) -> None:
+    """
+    Record a digest submitted to the Message Batches API.
+
+    Args:
+        date: Digest date in YYYY-MM-DD format.
+        batch_id: Message batch ID.
+        meeting_ids: IDs of the meetings included in the batch.
+    """
+    now = datetime.now(timezone.utc)
+
+    get_batches_table().put_item(
+        Item={
+            "date": date,
+            "batch_id": batch_id,
+            "meeting_ids": meeting_ids,
+            "created_at": now.isoformat(),
+            # Batches expire after 24 hours, so stale records can go too
+            "ttl": int((now + timedelta(days=2)).timestamp()),
+        }
+    )
+
+
+def get_cached_summary(prompt_hash: str) -> Optional[str]:
+    """
+    Get a cached summary for a prompt hash.
+
+    Args:
+        prompt_hash: Hash of the model, system prompt and user prompt.
+
+    Returns:
+        The cached summary HTML, or None on a miss or if caching is off.
+    """
+    table = get_summary_cache_table()
+    if table is None:
+        return None
+
+    item = table.get_item(Key={"prompt_hash": prompt_hash}).get("Item")
+    return item["summary"] if item else None
+
+
+def store_cached_summary(prompt_hash: str, summary: str) -> None:
+    """Cache a summary for a prompt hash for 24 hours."""
+    table = get_summary_cache_table()
+    if table is None:
+        return
+
+    now = datetime.now(timezone.utc)
+
+    table.put_item(
+        Item={
+            "prompt_hash": prompt_hash,
+            "summary": summary,
+            "ttl": int((now + timedelta(days=1)).timestamp()),
+        }
+    )
+
+
+def get_pending_digest_batches() -> list[dict]:
+    """Get all digest batches that have not been delivered or marked failed."""
+    return _collect_pages(
+        get_batches_table().scan,
+        FilterExpression=Attr("status").not_exists(),
+    )
+
+
+def mark_digest_batch_failed(date: str, error: str) -> None:
+    """
+    Mark a digest batch record as failed so it is no longer polled.
+
+    The record is kept until its TTL so the failure can be inspected.
+
+    Args:
+        date: Digest date in YYYY-MM-DD format.
+        error: Description of the failure.
+    """
+    get_batches_table().update_item(
+        Key={"date": date},
+        UpdateExpression="SET #status = :status, #error = :error",
+        ExpressionAttributeNames={"#status": "status", "#error": "error"},
+        ExpressionAttributeValues={":status": "failed", ":error": error},
+    )
 
-    for meeting in meetings:
-        delete_meeting(date, meeting["meeting_id"])
 
-    return len(meetings)
+def delete_digest_batch(date: str) -> None:
+    """Remove a digest batch record once it has been handled."""
+    get_batches_table().delete_item(Key={"date": date})
@@ -1,63 +1,26 @@
 """Claude API summarization for meeting content."""
 
+import asyncio
+import hashlib
+import html
+import io
+import logging
+import os
+import random
+import string
+import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, TypeVar
 
 import anthropic
 
+from .storage import get_cached_summary, store_cached_summary
 
-def summarize_all_meetings(
-    meetings: list[dict],
-    api_key: str,
-    model: str = "claude-sonnet-4-20250514",
-) -> Optional[str]:
-    """
-    Summarize multiple meetings in one API call.
-
-    Args:
-        meetings: List of meeting dictionaries from DynamoDB.
-        api_key: Anthropic API key.
-        model: Claude model to use.
-
-    Returns:
-        HTML-formatted summary string, or None if failed.
-    """
-    if not meetings:
-        return None
-
-    # Prepare content for all meetings
-    meetings_content = []
-    for i, meeting in enumerate(meetings, 1):
-        title = meeting.get("title", "Untitled Meeting")
-        attendees = meeting.get("attendees", [])
-        notes = meeting.get("notes", "")
-        transcript = meeting.get("transcript", "")
-
-        attendee_str = ", ".join(attendees) if attendees else "Not specified"
-
-        content = f"""
----
-MEETING {i}: {title}
-ATTENDEES: {attendee_str}
-
-NOTES:
-{notes or 'No notes available'}
-"""
-        if transcript:
-            # Truncate transcript if too long (allow more for detailed summaries)
-            max_transcript = 50000
-            if len(transcript) > max_transcript:
-                transcript = transcript[:max_transcript] + "\n[Truncated...]"
-            content += f"\nTRANSCRIPT:\n{transcript}"
-
-        content += "\n---"
-        meetings_content.append(content)
-
-    all_content = "\n".join(meetings_content)
+logger = logging.getLogger(__name__)
 
-    prompt = f"""You are creating detailed meeting records for a CRM/database. Preserve valuable information - don't reduce to executive bullet points.
-
-You are processing {len(meetings)} meetings from today.
+# Static instructions are sent as system prompts, apart from the meeting content
+SUMMARIZE_ALL_SYSTEM = """You are creating detailed meeting records for a CRM/database. Preserve valuable information - don't reduce to executive bullet points.
 
 For EACH meeting, provide a record including:
 
@@ -76,146 +39,665 @@ Format your response as clean HTML. Use:
 - <strong> for emphasis on important items
 - <hr> to separate meetings
 
-Keep Discussion Overview brief. Put the detail in Key Information section instead.
-
-Here are today's meetings:
-
-{all_content}
-"""
-
-    client = anthropic.Anthropic(api_key=api_key)
-
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=8192,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        summary = response.content[0].text
-
-        if not summary.strip().startswith("<"):
-            summary = f"<div>{summary}</div>"
-
-        return summary
-
-    except Exception as e:
-        print(f"Error calling Claude API: {e}")
-        return None
+Keep Discussion Overview brief. Put the detail in Key Information section instead."""
 
+SUMMARIZE_ONE_SYSTEM = """You are a helpful assistant that creates concise meeting summaries.
+Your goal is to extract the key information and action items from a meeting.
 
-def format_digest_email(
-    meetings: list[dict],
-    summary: str,
-    date: str,
-) -> str:
-    """
-    Format the daily digest as a complete HTML email.
+For this meeting, please provide:
+1. A brief overview (2-3 sentences)
+2. Key discussion points (bullet points)
+3. Action items and next steps (if any)
+4. Important decisions made (if any)
 
-    Args:
-        meetings: List of meeting dictionaries.
-        summary: HTML summary content.
-        date: Date string (YYYY-MM-DD).
+Focus on what matters most for follow-up. Be concise but comprehensive.
 
-    Returns:
-        Complete HTML email body.
-    """
-    date_formatted = datetime.strptime(date, "%Y-%m-%d").strftime("%A, %B %d, %Y")
-    meeting_count = len(meetings)
+Format your response as clean HTML suitable for an email. Use:
+- <h3> for section headers
+- <ul><li> for bullet points
+- <p> for paragraphs
+- <strong> for emphasis on important items"""
 
-    meeting_list = "".join([
-        f"<li>{m.get('title', 'Untitled')}</li>"
-        for m in meetings
-    ])
+# User prompt pieces; filled with format_map as the prompt is written out
+_DIGEST_PROMPT_HEADER = "You are processing {count} meetings from today.\n\nHere are today's meetings:\n\n"
+_DIGEST_PROMPT_MEETING = "\n---\nMEETING {number}: {title}\nATTENDEES: {attendees}\n\nNOTES:\n{notes}\n"
+_MEETING_PROMPT = "Here is the meeting content:\n\nMEETING TITLE: {title}\n\nATTENDEES: {attendees}\n\nNOTES:\n{notes}\n"
 
-    return f"""<!DOCTYPE html>
+# Email templates are parsed once at import; $placeholders are filled per call
+_DIGEST_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
             line-height: 1.6;
             color: #333;
             max-width: 800px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #1a1a2e;
             border-bottom: 2px solid #4a4e69;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #4a4e69;
             margin-top: 30px;
             border-left: 4px solid #4a4e69;
             padding-left: 15px;
-        }}
-        h3 {{
+        }
+        h3 {
             color: #22223b;
             margin-top: 20px;
             font-size: 16px;
-        }}
-        ul {{
+        }
+        ul {
             padding-left: 20px;
-        }}
-        li {{
+        }
+        li {
             margin-bottom: 8px;
-        }}
-        hr {{
+        }
+        hr {
             border: none;
             border-top: 1px solid #ddd;
             margin: 30px 0;
-        }}
-        .meta {{
+        }
+        .meta {
             color: #666;
             font-size: 0.9em;
             margin-bottom: 20px;
-        }}
-        .toc {{
+        }
+        .toc {
             background: #f5f5f5;
             padding: 15px 20px;
             border-radius: 5px;
             margin-bottom: 30px;
-        }}
-        .toc h3 {{
+        }
+        .toc h3 {
             margin-top: 0;
             margin-bottom: 10px;
-        }}
-        .toc ul {{
+        }
+        .toc ul {
             margin: 0;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 40px;
             padding-top: 20px;
             border-top: 1px solid #ddd;
             font-size: 0.85em;
             color: #666;
-        }}
+        }
     </style>
 </head>
 <body>
     <h1>Daily Meeting Digest</h1>
-    <p class="meta">{date_formatted} &bull; {meeting_count} meeting{"s" if meeting_count != 1 else ""}</p>
+    <p class="meta">$date_formatted &bull; $meeting_count meeting$plural</p>
 
     <div class="toc">
         <h3>Today's Meetings</h3>
         <ul>
-            {meeting_list}
+            $meeting_list
         </ul>
     </div>
 
-    {summary}
+    $summary
 
     <div class="footer">
         <p>This digest was automatically generated from Granola meeting notes using Claude AI.</p>
     </div>
 </body>
 </html>
-"""
+""")
+
+_SUMMARY_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        h1 {
+            color: #1a1a2e;
+            border-bottom: 2px solid #4a4e69;
+            padding-bottom: 10px;
+            font-size: 24px;
+        }
+        h2 {
+            color: #4a4e69;
+            margin-top: 30px;
+            font-size: 18px;
+        }
+        h3 {
+            color: #22223b;
+            margin-top: 20px;
+            font-size: 16px;
+        }
+        ul {
+            padding-left: 20px;
+        }
+        li {
+            margin-bottom: 8px;
+        }
+        .meta {
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 20px;
+        }
+        .attendees {
+            background: #f5f5f5;
+            padding: 10px 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            font-size: 0.85em;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+    <p class="meta">$today</p>
+    <div class="attendees">
+        <strong>Attendees:</strong> $attendee_list
+    </div>
+
+    $summary
+
+    <div class="footer">
+        <p>This summary was automatically generated from Granola meeting notes using Claude AI.</p>
+    </div>
+</body>
+</html>
+""")
+
+# Single-meeting summaries favor latency; override with CLAUDE_MODEL
+_DEFAULT_MEETING_MODEL = "claude-haiku-4-5"
+
+# Per-meeting transcript cap in the daily digest prompt
+_MAX_DIGEST_TRANSCRIPT = 50000
+
+# Transcript cap in a single-meeting summary prompt
+_MAX_MEETING_TRANSCRIPT = 50000
+
+# Notes and transcript characters per digest group; groups are sized to keep
+# each call's output under its cap
+_DIGEST_CHUNK_CHARS = 80_000
+
+# Input budget for a digest prompt, checked locally at roughly 4 characters
+# per token so an oversized prompt is trimmed instead of rejected after upload
+_PROMPT_TOKEN_BUDGET = 180_000
+_CHARS_PER_TOKEN = 4
+
+# Transient API errors are retried here with jittered exponential backoff;
+# the SDK's own retries are disabled so attempts are not multiplied
+_MAX_ATTEMPTS = 4
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504, 529}
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Get an Anthropic client, reused across warm invocations.
+
+    Reusing the client keeps its HTTP connection pool, so later calls skip
+    the TCP and TLS handshake.
+    """
+    return anthropic.Anthropic(api_key=api_key, max_retries=0)
+
+
+def _is_retryable(error: anthropic.APIError) -> bool:
+    """Check for rate limits, overload, 5xx, and connection errors or timeouts."""
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in _RETRYABLE_STATUSES
+    return isinstance(error, anthropic.APIConnectionError)
+
+
+def _with_retries(call: Callable[[], T]) -> T:
+    """Run an API call, retrying rate limit, connection and 5xx errors."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return call()
+        except anthropic.APIError as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = 2 ** attempt + random.uniform(0, 0.5)
+            logger.warning("Claude API error (%s), retrying in %.1fs", e.__class__.__name__, delay)
+            time.sleep(delay)
+
+
+async def _with_retries_async(call: Callable[[], Awaitable[T]]) -> T:
+    """Async counterpart of _with_retries, backing off without blocking the loop."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await call()
+        except anthropic.APIError as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = 2 ** attempt + random.uniform(0, 0.5)
+            logger.warning("Claude API error (%s), retrying in %.1fs", e.__class__.__name__, delay)
+            await asyncio.sleep(delay)
+
+
+def summarize_all_meetings(
+    meetings: list[dict],
+    api_key: str,
+    model: str = "claude-sonnet-4-20250514",
+) -> Optional[str]:
+    """
+    Summarize multiple meetings, in one API call unless the day is large.
+
+    Large days are split into groups that are summarized concurrently.
+
+    Args:
+        meetings: List of meeting dictionaries from DynamoDB.
+        api_key: Anthropic API key.
+        model: Claude model to use.
+
+    Returns:
+        HTML-formatted summary string, or None if failed.
+    """
+    if not meetings:
+        return None
+
+    # Split large days into groups so no single call hits the output cap
+    chunks = _chunk_meetings(meetings)
+    prompts = []
+    start = 1
+    for chunk in chunks:
+        prompts.append(_build_digest_prompt(chunk, start))
+        start += len(chunk)
+
+    if len(prompts) == 1:
+        return _summarize_digest_chunk(_get_client(api_key), prompts[0], model)
+
+    # Summarize groups concurrently on one event loop; the calls are network-bound
+    parts = asyncio.run(_summarize_digest_chunks_async(prompts, api_key, model))
+
+    # A partial digest would let unsummarized meetings be deleted
+    if not all(parts):
+        return None
+
+    return "<hr>".join(parts)
+
+
+def _chunk_meetings(
+    meetings: list[dict],
+    max_chars: int = _DIGEST_CHUNK_CHARS,
+) -> list[list[dict]]:
+    """
+    Greedily pack meetings into groups by notes and transcript size.
+
+    Args:
+        meetings: List of meeting dictionaries.
+        max_chars: Approximate content budget per group.
+
+    Returns:
+        List of meeting groups, in the original order.
+    """
+    chunks = []
+    current = []
+    current_chars = 0
+
+    for meeting in meetings:
+        size = len(meeting.get("notes") or "")
+        size += min(len(meeting.get("transcript") or ""), _MAX_DIGEST_TRANSCRIPT)
+
+        if current and current_chars + size > max_chars:
+            chunks.append(current)
+            current = []
+            current_chars = 0
+
+        current.append(meeting)
+        current_chars += size
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _transcript_limits(meetings: list[dict], max_transcript: int) -> list[int]:
+    """
+    Get how many transcript characters to include for each meeting.
+
+    If notes and transcripts together exceed _PROMPT_TOKEN_BUDGET, the
+    longest transcripts are cut down to a common length, so shorter ones
+    stay whole, until they fit in what the notes leave over.
+
+    Args:
+        meetings: List of meeting dictionaries.
+        max_transcript: Per-meeting transcript cap.
+
+    Returns:
+        Character limit per meeting, in the original order.
+    """
+    limits = [min(len(m.get("transcript") or ""), max_transcript) for m in meetings]
+    notes_chars = sum(len(m.get("notes") or "") for m in meetings)
+    available = max(_PROMPT_TOKEN_BUDGET * _CHARS_PER_TOKEN - notes_chars, 0)
+
+    if sum(limits) <= available:
+        return limits
+
+    # Find the longest transcript length that fits: shorter transcripts are
+    # kept whole and the rest share what is left equally
+    level = 0
+    remaining = available
+    by_length = sorted(limits)
+    for i, limit in enumerate(by_length):
+        longer = len(by_length) - i
+        if limit * longer > remaining:
+            level = remaining // longer
+            break
+        remaining -= limit
+
+    for i, limit in enumerate(limits):
+        if limit > level:
+            logger.warning(
+                "Trimmed transcript for '%s' from %d to %d characters to fit prompt budget",
+                meetings[i].get("title", "Untitled Meeting"), limit, level,
+            )
+            limits[i] = level
+
+    return limits
+
+
+def _build_digest_prompt(meetings: list[dict], start: int = 1) -> str:
+    """Build the user prompt for a group of meetings, numbered from start."""
+    limits = _transcript_limits(meetings, _MAX_DIGEST_TRANSCRIPT)
+
+    # Write into one buffer so long transcripts are copied only once
+    buf = io.StringIO()
+    buf.write(_DIGEST_PROMPT_HEADER.format_map({"count": len(meetings)}))
+
+    for i, (meeting, limit) in enumerate(zip(meetings, limits), start):
+        title = meeting.get("title", "Untitled Meeting")
+        notes = meeting.get("notes", "")
+        transcript = meeting.get("transcript", "")
+
+        # Meetings stored before attendees_display existed fall back to a join
+        attendee_str = (
+            meeting.get("attendees_display")
+            or ", ".join(meeting.get("attendees", ()))
+            or "Not specified"
+        )
+
+        if i > start:
+            buf.write("\n")
+        buf.write(_DIGEST_PROMPT_MEETING.format_map({
+            "number": i,
+            "title": title,
+            "attendees": attendee_str,
+            "notes": notes or "No notes available",
+        }))
+
+        if transcript and limit:
+            buf.write("\nTRANSCRIPT:\n")
+            # Truncate transcript if too long (allow more for detailed summaries)
+            if len(transcript) > limit:
+                buf.write(transcript[:limit])
+                buf.write("\n[Truncated...]")
+            else:
+                buf.write(transcript)
+
+        buf.write("\n---")
+
+    buf.write("\n")
+    return buf.getvalue()
+
+
+def _prompt_hash(model: str, system: str, prompt: str) -> str:
+    """Hash everything that determines a response, for the summary cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, system, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _digest_params(prompt: str, model: str) -> dict:
+    """Build the Messages API parameters for one digest prompt."""
+    return {
+        "model": model,
+        "max_tokens": 8192,
+        "system": SUMMARIZE_ALL_SYSTEM,
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+    }
+
+
+def _read_summary_cache(prompt_hash: str) -> Optional[str]:
+    """Look up a cached summary, treating cache errors as a miss."""
+    try:
+        summary = get_cached_summary(prompt_hash)
+    except Exception as e:
+        logger.warning("Error reading summary cache: %s", e)
+        return None
+
+    logger.debug("Summary cache %s for %s", "hit" if summary is not None else "miss", prompt_hash)
+    return summary
+
+
+def _write_summary_cache(prompt_hash: str, summary: str) -> None:
+    """Cache a summary, logging rather than raising on cache errors."""
+    try:
+        store_cached_summary(prompt_hash, summary)
+    except Exception as e:
+        logger.warning("Error writing summary cache: %s", e)
+
+
+def _summarize_digest_chunk(
+    client: anthropic.Anthropic,
+    prompt: str,
+    model: str,
+) -> Optional[str]:
+    """
+    Call Claude for one digest prompt, returning HTML or None if failed.
+
+    Responses are cached by prompt hash, so re-running a digest for the same
+    meetings (e.g. a manual retry) skips the API call.
+    """
+    prompt_hash = _prompt_hash(model, SUMMARIZE_ALL_SYSTEM, prompt)
+
+    cached = _read_summary_cache(prompt_hash)
+    if cached is not None:
+        return cached
+
+    try:
+        response = _with_retries(
+            lambda: client.messages.create(**_digest_params(prompt, model))
+        )
+
+        summary = response.content[0].text
+
+        if not summary.strip().startswith("<"):
+            summary = f"<div>{summary}</div>"
+
+    except Exception as e:
+        logger.error("Error calling Claude API: %s", e)
+        return None
+
+    _write_summary_cache(prompt_hash, summary)
+    return summary
+
+
+async def _summarize_digest_chunks_async(
+    prompts: list[str],
+    api_key: str,
+    model: str,
+) -> list[Optional[str]]:
+    """Summarize several digest prompts concurrently, in prompt order."""
+    # The async client is bound to this event loop, so it is not reused
+    async with anthropic.AsyncAnthropic(api_key=api_key, max_retries=0) as client:
+        return await asyncio.gather(*(
+            _summarize_digest_chunk_async(client, prompt, model)
+            for prompt in prompts
+        ))
+
+
+async def _summarize_digest_chunk_async(
+    client: anthropic.AsyncAnthropic,
+    prompt: str,
+    model: str,
+) -> Optional[str]:
+    """
+    Async counterpart of _summarize_digest_chunk.
+
+    The summary cache uses blocking boto3 calls, so they run in a worker
+    thread to keep the other chunks' requests moving.
+    """
+    prompt_hash = _prompt_hash(model, SUMMARIZE_ALL_SYSTEM, prompt)
+
+    cached = await asyncio.to_thread(_read_summary_cache, prompt_hash)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await _with_retries_async(
+            lambda: client.messages.create(**_digest_params(prompt, model))
+        )
+
+        summary = response.content[0].text
+
+        if not summary.strip().startswith("<"):
+            summary = f"<div>{summary}</div>"
+
+    except Exception as e:
+        logger.error("Error calling Claude API: %s", e)
+        return None
+
+    await asyncio.to_thread(_write_summary_cache, prompt_hash, summary)
+    return summary
+
+
+def submit_digest_batch(
+    meetings: list[dict],
+    api_key: str,
+    model: str = "claude-sonnet-4-20250514",
+) -> Optional[str]:
+    """
+    Submit the digest to the Message Batches API without waiting for it.
+
+    Each meeting group (see _chunk_meetings) becomes one batch request.
+    Collect the result later with collect_digest_batch.
+
+    Args:
+        meetings: List of meeting dictionaries from DynamoDB.
+        api_key: Anthropic API key.
+        model: Claude model to use.
+
+    Returns:
+        The batch ID, or None if submission failed.
+    """
+    if not meetings:
+        return None
+
+    requests = []
+    start = 1
+    for i, chunk in enumerate(_chunk_meetings(meetings)):
+        requests.append({
+            "custom_id": f"chunk-{i}",
+            "params": _digest_params(_build_digest_prompt(chunk, start), model),
+        })
+        start += len(chunk)
+
+    client = _get_client(api_key)
+
+    try:
+        batch = client.messages.batches.create(requests=requests)
+        return batch.id
+
+    except Exception as e:
+        logger.error("Error submitting digest batch: %s", e)
+        return None
+
+
+def collect_digest_batch(batch_id: str, api_key: str) -> tuple[bool, Optional[str]]:
+    """
+    Collect a digest submitted with submit_digest_batch.
+
+    Args:
+        batch_id: Message batch ID.
+        api_key: Anthropic API key.
+
+    Returns:
+        Tuple of (finished, summary). summary is None while the batch is
+        still processing, or if any of its requests did not succeed.
+    """
+    client = _get_client(api_key)
+
+    batch = client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        return False, None
+
+    parts = {}
+    for entry in client.messages.batches.results(batch_id):
+        if entry.result.type != "succeeded":
+            logger.warning("Digest batch request %s %s", entry.custom_id, entry.result.type)
+            return True, None
+
+        summary = entry.result.message.content[0].text
+        if not summary.strip().startswith("<"):
+            summary = f"<div>{summary}</div>"
+        parts[entry.custom_id] = summary
+
+    # Results are not guaranteed to come back in submission order
+    ordered = sorted(parts, key=lambda custom_id: int(custom_id.split("-")[1]))
+    return True, "<hr>".join(parts[custom_id] for custom_id in ordered)
+
+
+@lru_cache(maxsize=32)
+def _format_long_date(date: str) -> str:
+    """Format a YYYY-MM-DD date for display, memoized per warm container."""
+    return datetime.strptime(date, "%Y-%m-%d").strftime("%A, %B %d, %Y")
+
+
+def format_digest_email(
+    meetings: list[dict],
+    summary: str,
+    date: str,
+) -> str:
+    """
+    Format the daily digest as a complete HTML email.
+
+    Args:
+        meetings: List of meeting dictionaries.
+        summary: HTML summary content.
+        date: Date string (YYYY-MM-DD).
+
+    Returns:
+        Complete HTML email body.
+    """
+    date_formatted = _format_long_date(date)
+    meeting_count = len(meetings)
+
+    # Titles come from the webhook, so escape them before embedding
+    meeting_list = "".join(
+        "<li>%s</li>" % html.escape(m.get("title", "Untitled"))
+        for m in meetings
+    )
+
+    return _DIGEST_TEMPLATE.substitute(
+        date_formatted=date_formatted,
+        meeting_count=meeting_count,
+        plural="s" if meeting_count != 1 else "",
+        meeting_list=meeting_list,
+        summary=summary,
+    )
 
 
 def summarize_meeting(
@@ -224,10 +706,10 @@ def summarize_meeting(
     notes: str,
     transcript: Optional[str],
     api_key: str,
-    model: str = "claude-sonnet-4-20250514",
+    model: Optional[str] = None,
 ) -> Optional[str]:
     """
-    Summarize meeting content using Claude API.
+    Summarize meeting content using Claude API, streaming the response.
 
     Args:
         title: Meeting title.
@@ -235,61 +717,49 @@ def summarize_meeting(
         notes: Meeting notes from Granola.
         transcript: Full transcript (optional).
         api_key: Anthropic API key.
-        model: Claude model to use.
+        model: Claude model to use. Defaults to CLAUDE_MODEL, else Haiku.
 
     Returns:
         HTML-formatted summary string, or None if failed.
     """
-    # Prepare content for summarization
-    content = f"""MEETING TITLE: {title}
-
-ATTENDEES: {', '.join(attendees) if attendees else 'Not specified'}
-
-NOTES:
-{notes or 'No notes available'}
-"""
+    # Prepare content for summarization in a single buffer
+    buf = io.StringIO()
+    buf.write(_MEETING_PROMPT.format_map({
+        "title": title,
+        "attendees": ", ".join(attendees) if attendees else "Not specified",
+        "notes": notes or "No notes available",
+    }))
 
     if transcript:
+        buf.write("\nTRANSCRIPT:\n")
         # Truncate transcript if too long
-        max_transcript = 50000
-        if len(transcript) > max_transcript:
-            transcript = transcript[:max_transcript] + "\n\n[Transcript truncated...]"
-        content += f"\nTRANSCRIPT:\n{transcript}"
-
-    prompt = f"""You are a helpful assistant that creates concise meeting summaries.
-Your goal is to extract the key information and action items from a meeting.
-
-For this meeting, please provide:
-1. A brief overview (2-3 sentences)
-2. Key discussion points (bullet points)
-3. Action items and next steps (if any)
-4. Important decisions made (if any)
-
-Focus on what matters most for follow-up. Be concise but comprehensive.
-
-Format your response as clean HTML suitable for an email. Use:
-- <h3> for section headers
-- <ul><li> for bullet points
-- <p> for paragraphs
-- <strong> for emphasis on important items
+        if len(transcript) > _MAX_MEETING_TRANSCRIPT:
+            buf.write(transcript[:_MAX_MEETING_TRANSCRIPT])
+            buf.write("\n\n[Transcript truncated...]")
+        else:
+            buf.write(transcript)
 
-Here is the meeting content:
+    buf.write("\n")
+    prompt = buf.getvalue()
 
-{content}
-"""
+    if model is None:
+        model = os.environ.get("CLAUDE_MODEL", _DEFAULT_MEETING_MODEL)
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client(api_key)
 
-    try:
-        response = client.messages.create(
+    def _stream_summary() -> str:
+        with client.messages.stream(
             model=model,
             max_tokens=2048,
+            system=SUMMARIZE_ONE_SYSTEM,
             messages=[
                 {"role": "user", "content": prompt}
             ]
-        )
+        ) as stream:
+            return "".join(stream.text_stream)
 
-        summary = response.content[0].text
+    try:
+        summary = _with_retries(_stream_summary)
 
         # Wrap in basic HTML structure if not already wrapped
         if not summary.strip().startswith("<"):
@@ -298,7 +768,7 @@ Here is the meeting content:
         return summary
 
     except Exception as e:
-        print(f"Error calling Claude API: {e}")
+        logger.error("Error calling Claude API: %s", e)
         return None
 
 
@@ -321,73 +791,9 @@ def format_summary_email(
     today = datetime.now().strftime("%A, %B %d, %Y")
     attendee_list = ', '.join(attendees) if attendees else 'Not specified'
 
-    return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        h1 {{
-            color: #1a1a2e;
-            border-bottom: 2px solid #4a4e69;
-            padding-bottom: 10px;
-            font-size: 24px;
-        }}
-        h2 {{
-            color: #4a4e69;
-            margin-top: 30px;
-            font-size: 18px;
-        }}
-        h3 {{
-            color: #22223b;
-            margin-top: 20px;
-            font-size: 16px;
-        }}
-        ul {{
-            padding-left: 20px;
-        }}
-        li {{
-            margin-bottom: 8px;
-        }}
-        .meta {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 20px;
-        }}
-        .attendees {{
-            background: #f5f5f5;
-            padding: 10px 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            font-size: 0.85em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <h1>{title}</h1>
-    <p class="meta">{today}</p>
-    <div class="attendees">
-        <strong>Attendees:</strong> {attendee_list}
-    </div>
-
-    {summary}
-
-    <div class="footer">
-        <p>This summary was automatically generated from Granola meeting notes using Claude AI.</p>
-    </div>
-</body>
-</html>
-"""
+    return _SUMMARY_TEMPLATE.substitute(
+        title=title,
+        today=today,
+        attendee_list=attendee_list,
+        summary=summary,
+    )
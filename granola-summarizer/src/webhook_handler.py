@@ -4,8 +4,10 @@ import json
 import logging
 import os
 
+import orjson
+
 from .config import load_config
-from .filters import should_skip_meeting
+from .filters import parse_attendees, should_skip_meeting
 from .storage import store_meeting
 
 # Configure logging
@@ -32,21 +34,14 @@ def lambda_handler(event: dict, context) -> dict:
         # Parse the webhook payload
         body = event.get("body", "{}")
         if isinstance(body, str):
-            payload = json.loads(body)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            payload = orjson.loads(body)
         else:
             payload = body
 
-        logger.info(f"Payload: {json.dumps(payload, default=str)[:500]}")
-
-        # Extract meeting data
+        # Only title and attendees are needed to decide whether to skip
         title = payload.get("title", "Untitled Meeting")
-        attendees = payload.get("attendees", [])
-        notes = payload.get("notes", "")
-        transcript = payload.get("transcript")
-
-        # Handle attendees as string or list
-        if isinstance(attendees, str):
-            attendees = [a.strip() for a in attendees.split(",") if a.strip()]
+        attendees = parse_attendees(payload.get("attendees", []))
 
         logger.info(f"Meeting: {title}")
         logger.info(f"Attendees: {attendees}")
@@ -69,6 +64,15 @@ def lambda_handler(event: dict, context) -> dict:
                 }),
             }
 
+        # Payloads can carry long transcripts; only serialize when INFO is on,
+        # and only for meetings that pass the filters
+        if logger.isEnabledFor(logging.INFO):
+            preview = orjson.dumps(payload, default=str)[:500]
+            logger.info("Payload: %s", preview.decode("utf-8", errors="replace"))
+
+        notes = payload.get("notes", "")
+        transcript = payload.get("transcript")
+
         # Store meeting in DynamoDB
         meeting_id = store_meeting(
             title=title,
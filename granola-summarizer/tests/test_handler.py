@@ -2,9 +2,9 @@
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
-from src.filters import should_skip_meeting, _extract_email
+from src.filters import should_skip_meeting, parse_attendees, _extract_email
 from src.config import FilterConfig
 
 
@@ -69,6 +69,18 @@ class TestFilters:
         assert reason is None
 
 
+class TestAttendeeParsing:
+    """Tests for normalizing the attendees field."""
+
+    def test_comma_separated_string(self):
+        assert parse_attendees(" a@x.com ,b@x.com, ,  c@x.com ") == [
+            "a@x.com", "b@x.com", "c@x.com",
+        ]
+
+    def test_list_passthrough(self):
+        assert parse_attendees(["a@x.com"]) == ["a@x.com"]
+
+
 class TestEmailExtraction:
     """Tests for email extraction from attendee strings."""
 
@@ -81,10 +93,324 @@ class TestEmailExtraction:
     def test_uppercase_email(self):
         assert _extract_email("USER@EXAMPLE.COM") == "user@example.com"
 
+    def test_plus_address(self):
+        assert _extract_email(" jane+granola@example.com ") == "jane+granola@example.com"
+
     def test_invalid_string(self):
         assert _extract_email("not an email") is None
 
 
+class TestStorage:
+    """Tests for DynamoDB storage helpers."""
+
+    def test_delete_meetings_uses_batch_writer(self):
+        from src.storage import delete_meetings_for_date
+
+        with patch("src.storage.get_meeting_ids_for_date") as mock_get, \
+             patch("src.storage.get_table") as mock_table:
+
+            mock_get.return_value = ["a", "b"]
+            batch = mock_table.return_value.batch_writer.return_value.__enter__.return_value
+
+            deleted = delete_meetings_for_date("2024-01-15")
+
+            assert deleted == 2
+            batch.delete_item.assert_any_call(Key={"date": "2024-01-15", "meeting_id": "a"})
+            batch.delete_item.assert_any_call(Key={"date": "2024-01-15", "meeting_id": "b"})
+            mock_table.return_value.delete_item.assert_not_called()
+
+    def test_delete_meetings_reuses_provided_list(self):
+        from src.storage import delete_meetings_for_date
+
+        with patch("src.storage.get_meeting_ids_for_date") as mock_get, \
+             patch("src.storage.get_table") as mock_table:
+
+            deleted = delete_meetings_for_date("2024-01-15", meetings=[{"meeting_id": "a"}])
+
+            assert deleted == 1
+            mock_get.assert_not_called()
+
+    def test_get_meetings_follows_pagination(self):
+        from src.storage import get_meetings_for_date
+
+        with patch("src.storage.get_table") as mock_table:
+            mock_table.return_value.query.side_effect = [
+                {"Items": [{"meeting_id": "a"}], "LastEvaluatedKey": {"meeting_id": "a"}},
+                {"Items": [{"meeting_id": "b"}]},
+            ]
+
+            meetings = get_meetings_for_date("2024-01-15")
+
+            assert [m["meeting_id"] for m in meetings] == ["a", "b"]
+            _, kwargs = mock_table.return_value.query.call_args
+            assert kwargs["ExclusiveStartKey"] == {"meeting_id": "a"}
+
+    def test_transcript_round_trips_compressed(self):
+        from boto3.dynamodb.types import Binary
+        from src.storage import get_meetings_for_date, store_meeting
+
+        with patch("src.storage.get_table") as mock_table:
+            store_meeting("Sync", [], "notes", transcript="hello " * 1000, date="2024-01-15")
+
+            item = mock_table.return_value.put_item.call_args.kwargs["Item"]
+            assert item["transcript_codec"] == "zstd"
+            assert len(item["transcript"]) < 6000
+
+            item["transcript"] = Binary(item["transcript"])
+            mock_table.return_value.query.return_value = {"Items": [item]}
+
+            meeting = get_meetings_for_date("2024-01-15")[0]
+
+            assert meeting["transcript"] == "hello " * 1000
+            assert "transcript_codec" not in meeting
+
+
+class TestSummarizer:
+    """Tests for digest prompt preparation."""
+
+    def test_chunk_meetings_packs_by_size(self):
+        from src.summarizer import _chunk_meetings
+
+        meetings = [
+            {"title": "A", "notes": "x" * 40},
+            {"title": "B", "notes": "x" * 40},
+            {"title": "C", "notes": "x" * 40},
+        ]
+
+        chunks = _chunk_meetings(meetings, max_chars=100)
+
+        assert [[m["title"] for m in chunk] for chunk in chunks] == [["A", "B"], ["C"]]
+
+    def test_chunk_meetings_keeps_small_days_together(self):
+        from src.summarizer import _chunk_meetings
+
+        meetings = [{"title": "A", "notes": "short"}, {"title": "B"}]
+
+        assert _chunk_meetings(meetings) == [meetings]
+
+    def test_transcript_limits_trim_longest_over_budget(self):
+        from src.summarizer import _transcript_limits
+
+        meetings = [
+            {"title": "A", "notes": "x" * 10, "transcript": "x" * 30},
+            {"title": "B", "transcript": "x" * 80},
+            {"title": "C", "transcript": "x" * 50},
+        ]
+
+        with patch("src.summarizer._PROMPT_TOKEN_BUDGET", 25):
+            assert _transcript_limits(meetings, 60) == [30, 30, 30]
+
+    def test_transcript_limits_keep_prompts_within_budget(self):
+        from src.summarizer import _transcript_limits
+
+        meetings = [{"title": "A", "notes": "short", "transcript": "x" * 40}]
+
+        assert _transcript_limits(meetings, 60) == [40]
+
+    def test_digest_chunk_uses_cached_summary(self):
+        from src.summarizer import _summarize_digest_chunk
+
+        client = MagicMock()
+
+        with patch("src.summarizer.get_cached_summary", return_value="<p>cached</p>"):
+            assert _summarize_digest_chunk(client, "prompt", "model") == "<p>cached</p>"
+
+        client.messages.create.assert_not_called()
+
+    def test_async_digest_chunk_caches_off_the_event_loop(self):
+        import asyncio
+        import threading
+        from src.summarizer import _summarize_digest_chunk_async
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(
+            return_value=MagicMock(content=[MagicMock(text="<p>new</p>")]),
+        )
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+
+        with patch("src.summarizer.get_cached_summary", side_effect=record_thread), \
+             patch("src.summarizer.store_cached_summary", side_effect=record_thread):
+            result = asyncio.run(_summarize_digest_chunk_async(client, "prompt", "model"))
+
+        assert result == "<p>new</p>"
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    def test_with_retries_retries_rate_limits(self):
+        import anthropic
+        from src.summarizer import _with_retries
+
+        error = anthropic.RateLimitError(
+            "rate limited", response=MagicMock(status_code=429), body=None,
+        )
+        call = MagicMock(side_effect=[error, "ok"])
+
+        with patch("src.summarizer.time.sleep") as mock_sleep:
+            assert _with_retries(call) == "ok"
+
+        assert call.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_with_retries_raises_client_errors(self):
+        import anthropic
+        from src.summarizer import _with_retries
+
+        error = anthropic.BadRequestError(
+            "bad request", response=MagicMock(status_code=400), body=None,
+        )
+        call = MagicMock(side_effect=error)
+
+        with pytest.raises(anthropic.BadRequestError):
+            _with_retries(call)
+
+        assert call.call_count == 1
+
+
+class TestGmailClient:
+    """Tests for Gmail message building and batch sending."""
+
+    @pytest.fixture
+    def client(self):
+        from src.gmail_client import GmailClient
+
+        with patch("src.gmail_client.build"):
+            return GmailClient({"token": "t"})
+
+    def test_message_headers_are_encoded_safely(self, client):
+        import base64
+        import email
+        from email import policy
+
+        message_bytes = client._build_message_bytes(
+            subject="Résumé review\r\nBcc: evil@example.com",
+            body_html="<p>Café</p>",
+            body_text="Café",
+        )
+        raw = client._encode_for_recipient("to@example.com", message_bytes)
+
+        decoded = base64.urlsafe_b64decode(raw)
+        assert decoded.isascii()
+
+        message = email.message_from_bytes(decoded, policy=policy.default)
+        assert message["To"] == "to@example.com"
+        assert message["Subject"] == "Résumé review Bcc: evil@example.com"
+        assert message["Bcc"] is None
+
+        text_part, html_part = message.iter_parts()
+        assert text_part.get_content().strip() == "Café"
+        assert html_part.get_content_type() == "text/html"
+        assert html_part.get_content().strip() == "<p>Café</p>"
+
+    def test_batch_resends_retryable_failures(self, client):
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        def execute():
+            callback = client.service.new_batch_http_request.call_args.kwargs["callback"]
+            callback("ok@example.com", {}, None)
+            callback("busy@example.com", None, HttpError(httplib2.Response({"status": 503}), b""))
+            callback("bad@example.com", None, HttpError(httplib2.Response({"status": 400}), b""))
+
+        client.service.new_batch_http_request.return_value.execute.side_effect = execute
+
+        with patch.object(client, "_send_parallel", return_value={"busy@example.com": True}) as mock_send:
+            results = client.send_email_batch(
+                ["ok@example.com", "busy@example.com", "bad@example.com"],
+                subject="Digest",
+                body_html="<p>Hi</p>",
+            )
+
+        assert list(mock_send.call_args.args[0]) == ["busy@example.com"]
+        assert results == {
+            "ok@example.com": True,
+            "busy@example.com": True,
+            "bad@example.com": False,
+        }
+
+    def test_failed_batch_falls_back_to_parallel_sends(self, client):
+        client.service.new_batch_http_request.return_value.execute.side_effect = OSError("reset")
+
+        with patch.object(client, "_send_parallel", return_value={"a@example.com": True}) as mock_send:
+            results = client.send_email_batch(
+                ["a@example.com"], subject="Digest", body_html="<p>Hi</p>",
+            )
+
+        assert list(mock_send.call_args.args[0]) == ["a@example.com"]
+        assert results == {"a@example.com": True}
+
+
+class TestDigestHandler:
+    """Tests for digest handler client reuse and batch polling."""
+
+    def test_gmail_client_rebuilt_on_rotated_credentials(self):
+        from src import digest_handler
+
+        old = MagicMock(gmail_credentials={"refresh_token": "old"})
+        new = MagicMock(gmail_credentials={"refresh_token": "new"})
+
+        with patch.object(digest_handler, "GmailClient") as mock_gmail, \
+             patch.object(digest_handler, "_GMAIL", None), \
+             patch.object(digest_handler, "_GMAIL_CREDENTIALS", None):
+
+            digest_handler._get_gmail_client(old)
+            digest_handler._get_gmail_client(old)
+            digest_handler._get_gmail_client(new)
+
+            assert mock_gmail.call_count == 2
+            mock_gmail.assert_called_with({"refresh_token": "new"})
+
+    def test_poll_continues_past_failing_record(self):
+        from src import digest_handler
+
+        records = [
+            {"date": "2024-01-01", "batch_id": "msgbatch_bad", "meeting_ids": []},
+            {"date": "2024-01-02", "batch_id": "msgbatch_good", "meeting_ids": []},
+        ]
+
+        def collect(batch_id, api_key):
+            if batch_id == "msgbatch_bad":
+                raise RuntimeError("boom")
+            return True, "<p>Summary</p>"
+
+        with patch.object(digest_handler, "_get_config"), \
+             patch.object(digest_handler, "get_pending_digest_batches", return_value=records), \
+             patch.object(digest_handler, "collect_digest_batch", side_effect=collect), \
+             patch.object(digest_handler, "get_meetings_for_date", return_value=[]), \
+             patch.object(digest_handler, "format_digest_email", return_value="<html></html>"), \
+             patch.object(digest_handler, "_send_digest", return_value={"statusCode": 200}), \
+             patch.object(digest_handler, "delete_digest_batch") as mock_delete, \
+             patch.object(digest_handler, "mark_digest_batch_failed") as mock_mark:
+
+            result = digest_handler.poll_handler({}, None)
+
+        body = json.loads(result["body"])
+        assert result["statusCode"] == 200
+        assert body["delivered"] == ["2024-01-02"]
+        assert body["failed"] == ["2024-01-01"]
+        mock_mark.assert_called_once_with("2024-01-01", "boom")
+        mock_delete.assert_called_once_with("2024-01-02")
+
+    def test_poll_marks_expired_batch_failed(self):
+        from src import digest_handler
+
+        record = {"date": "2024-01-01", "batch_id": "msgbatch_expired", "meeting_ids": []}
+
+        with patch.object(digest_handler, "_get_config"), \
+             patch.object(digest_handler, "get_pending_digest_batches", return_value=[record]), \
+             patch.object(digest_handler, "collect_digest_batch", return_value=(True, None)), \
+             patch.object(digest_handler, "get_meetings_for_date", return_value=[]), \
+             patch.object(digest_handler, "summarize_all_meetings", return_value=None), \
+             patch.object(digest_handler, "mark_digest_batch_failed") as mock_mark:
+
+            result = digest_handler.poll_handler({}, None)
+
+        assert json.loads(result["body"])["delivered"] == []
+        mock_mark.assert_called_once_with("2024-01-01", "Failed to generate summary")
+
+
 class TestWebhookPayload:
     """Tests for webhook payload handling."""
 
@@ -111,6 +437,13 @@ class TestWebhookPayload:
             # Should have parsed the attendees
             assert result["statusCode"] == 200
 
+    def test_webhook_rejects_invalid_json(self):
+        from src.webhook_handler import lambda_handler
+
+        result = lambda_handler({"body": "{not json"}, None)
+
+        assert result["statusCode"] == 400
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,15 +1,43 @@
 """Gmail API client for fetching and sending emails."""
 
 import base64
-import re
-from datetime import datetime, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import codecs
+import logging
+import time
+from email.message import EmailMessage
+from email.policy import SMTP
+from functools import lru_cache
 from typing import Optional
 
-from bs4 import BeautifulSoup
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from selectolax.lexbor import LexborHTMLParser
+
+logger = logging.getLogger(__name__)
+
+_UTF8_DECODE = codecs.getdecoder("utf-8")
+
+# Gmail accepts up to 100 calls per batch but rate-limits batches above ~50
+_BATCH_SIZE = 50
+
+# Only the headers and body data that are parsed, down to three levels of
+# nested multiparts (e.g. mixed > related > alternative)
+_PART_FIELDS = "mimeType,body/data"
+_MESSAGE_FIELDS = (
+    "payload(headers(name,value),mimeType,body/data,"
+    f"parts({_PART_FIELDS},parts({_PART_FIELDS},parts({_PART_FIELDS}))))"
+)
+
+
+def _decode_data(data: str) -> str:
+    """Decode a base64url Gmail body, dropping invalid UTF-8."""
+    return _UTF8_DECODE(base64.urlsafe_b64decode(data), "ignore")[0]
+
+
+@lru_cache(maxsize=8)
+def _sender_query(senders: tuple[str, ...]) -> str:
+    """Build the Gmail search clause matching any of the senders."""
+    return f"from:({' OR '.join(senders)})"
 
 
 class GmailClient:
@@ -40,6 +68,7 @@ class GmailClient:
         self,
         senders: list[str],
         hours_back: int = 24,
+        max_results: int = 50,
     ) -> list[dict]:
         """
         Fetch emails from specified senders within the time window.
@@ -47,6 +76,7 @@ class GmailClient:
         Args:
             senders: List of sender email addresses.
             hours_back: How many hours back to search.
+            max_results: Maximum number of emails to fetch.
 
         Returns:
             List of email dictionaries with 'subject', 'from', 'date', 'body'.
@@ -54,47 +84,88 @@ class GmailClient:
         if not senders:
             return []
 
-        # Build query for multiple senders
-        sender_queries = " OR ".join([f"from:{sender}" for sender in senders])
+        # Build query for multiple senders (the sender list rarely changes)
+        sender_query = _sender_query(tuple(senders))
 
-        # Calculate date filter
-        after_date = datetime.now() - timedelta(hours=hours_back)
-        after_timestamp = int(after_date.timestamp())
+        # Calculate date filter; whole days use Gmail's relative newer_than
+        if hours_back > 0 and hours_back % 24 == 0:
+            date_filter = f"newer_than:{hours_back // 24}d"
+        else:
+            date_filter = f"after:{int(time.time()) - hours_back * 3600}"
 
-        query = f"({sender_queries}) after:{after_timestamp}"
+        query = f"{sender_query} {date_filter}"
 
         try:
             results = self.service.users().messages().list(
                 userId="me",
                 q=query,
-                maxResults=50,
+                maxResults=max_results,
+                fields="messages/id",
             ).execute()
         except Exception as e:
-            print(f"Error fetching email list: {e}")
+            logger.warning("Error fetching email list: %s", e)
             return []
 
-        messages = results.get("messages", [])
+        message_ids = [msg["id"] for msg in results.get("messages", [])]
+        messages = self._get_messages(message_ids)
+
         emails = []
+        for message_id in message_ids:
+            message = messages.get(message_id)
+            if message is None:
+                continue
 
-        for msg in messages:
             try:
-                email_data = self._get_email_content(msg["id"])
+                email_data = self._parse_message(message)
                 if email_data:
                     emails.append(email_data)
             except Exception as e:
-                print(f"Error fetching email {msg['id']}: {e}")
+                logger.warning("Error parsing email %s: %s", message_id, e)
                 continue
 
         return emails
 
-    def _get_email_content(self, message_id: str) -> Optional[dict]:
-        """Fetch and parse a single email by ID."""
-        message = self.service.users().messages().get(
-            userId="me",
-            id=message_id,
-            format="full",
-        ).execute()
+    def _get_messages(self, message_ids: list[str]) -> dict[str, dict]:
+        """
+        Fetch full messages in batch requests instead of one call per message.
+
+        Args:
+            message_ids: Gmail message IDs.
+
+        Returns:
+            Dictionary mapping message ID to message resource. Messages that
+            failed to fetch are left out.
+        """
+        messages = {}
+
+        def _callback(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Error fetching email %s: %s", request_id, exception)
+                return
+            messages[request_id] = response
+
+        for start in range(0, len(message_ids), _BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_callback)
+            for message_id in message_ids[start:start + _BATCH_SIZE]:
+                batch.add(
+                    self.service.users().messages().get(
+                        userId="me",
+                        id=message_id,
+                        format="full",
+                        fields=_MESSAGE_FIELDS,
+                    ),
+                    request_id=message_id,
+                )
+
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning("Error fetching email batch: %s", e)
+
+        return messages
 
+    def _parse_message(self, message: dict) -> Optional[dict]:
+        """Parse a full message resource into an email dictionary."""
         headers = message.get("payload", {}).get("headers", [])
 
         subject = ""
@@ -125,59 +196,59 @@ class GmailClient:
 
     def _extract_body(self, payload: dict) -> str:
         """Extract plain text body from email payload."""
-        body_text = ""
-
-        # Check for direct body data
-        if "body" in payload and payload["body"].get("data"):
-            body_text = base64.urlsafe_b64decode(
-                payload["body"]["data"]
-            ).decode("utf-8", errors="ignore")
-
-        # Check for parts (multipart emails)
-        if "parts" in payload:
-            for part in payload["parts"]:
-                mime_type = part.get("mimeType", "")
-
-                if mime_type == "text/plain":
-                    if part.get("body", {}).get("data"):
-                        body_text = base64.urlsafe_b64decode(
-                            part["body"]["data"]
-                        ).decode("utf-8", errors="ignore")
-                        break
-                elif mime_type == "text/html":
-                    if part.get("body", {}).get("data"):
-                        html_content = base64.urlsafe_b64decode(
-                            part["body"]["data"]
-                        ).decode("utf-8", errors="ignore")
-                        body_text = self._html_to_text(html_content)
-                elif mime_type.startswith("multipart/"):
-                    # Recursively extract from nested parts
-                    nested_body = self._extract_body(part)
-                    if nested_body:
-                        body_text = nested_body
-                        break
-
-        return body_text.strip()
+        parts = payload.get("parts")
+
+        # Multipart emails: only the chosen part is decoded. A text/plain
+        # alternative is preferred so the HTML part is only decoded and
+        # parsed without one.
+        if parts:
+            plain_data = self._find_part_data(parts, "text/plain")
+            if plain_data:
+                return _decode_data(plain_data).strip()
+
+            html_data = self._find_part_data(parts, "text/html")
+            if html_data:
+                return self._html_to_text(_decode_data(html_data)).strip()
+
+            return ""
+
+        # Single-part emails carry their body directly
+        data = payload.get("body", {}).get("data")
+        return _decode_data(data).strip() if data else ""
+
+    def _find_part_data(self, parts: list[dict], mime_type: str) -> Optional[str]:
+        """Find the body data of the first part with mime_type, searching nested multiparts."""
+        for part in parts:
+            part_type = part.get("mimeType", "")
+
+            if part_type == mime_type:
+                data = part.get("body", {}).get("data")
+                if data:
+                    return data
+            elif part_type.startswith("multipart/"):
+                data = self._find_part_data(part.get("parts", []), mime_type)
+                if data:
+                    return data
+
+        return None
 
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text."""
-        soup = BeautifulSoup(html, "html.parser")
+        body = LexborHTMLParser(html).body
+        if body is None:
+            return ""
 
-        # Remove script and style elements
-        for element in soup(["script", "style", "head", "meta"]):
+        # Only body text is read, so only scripts and styles inside it need removing
+        for element in body.css("script, style"):
             element.decompose()
 
         # Get text and clean up whitespace
-        text = soup.get_text(separator="\n")
+        text = body.text(separator="\n")
 
-        # Clean up excessive whitespace
+        # Clean up excessive whitespace; dropping blank lines also means
+        # runs of newlines cannot survive
         lines = [line.strip() for line in text.splitlines()]
-        text = "\n".join(line for line in lines if line)
-
-        # Remove excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        return text
+        return "\n".join(line for line in lines if line)
 
     def send_email(
         self,
@@ -193,29 +264,24 @@ class GmailClient:
             to: Recipient email address.
             subject: Email subject.
             body_html: HTML body content.
-            body_text: Plain text body (optional, derived from HTML if not provided).
+            body_text: Plain text body (optional). Without it, only the HTML
+                part is sent rather than deriving text by parsing the HTML.
 
         Returns:
             True if sent successfully, False otherwise.
         """
-        message = MIMEMultipart("alternative")
-        message["to"] = to
-        message["subject"] = subject
+        message = EmailMessage(policy=SMTP)
+        message["To"] = to
+        message["Subject"] = subject
 
-        # Add plain text version
         if body_text is None:
-            body_text = self._html_to_text(body_html)
-
-        part1 = MIMEText(body_text, "plain")
-        part2 = MIMEText(body_html, "html")
-
-        message.attach(part1)
-        message.attach(part2)
+            message.set_content(body_html, subtype="html")
+        else:
+            message.set_content(body_text)
+            message.add_alternative(body_html, subtype="html")
 
-        # Encode the message
-        raw_message = base64.urlsafe_b64encode(
-            message.as_bytes()
-        ).decode("utf-8")
+        # Encode the message; base64 output is always ASCII
+        raw_message = base64.urlsafe_b64encode(bytes(message)).decode("ascii")
 
         try:
             self.service.users().messages().send(
@@ -224,5 +290,5 @@ class GmailClient:
             ).execute()
             return True
         except Exception as e:
-            print(f"Error sending email: {e}")
+            logger.warning("Error sending email: %s", e)
             return False
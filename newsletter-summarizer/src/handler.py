@@ -4,8 +4,9 @@ import json
 import logging
 import os
 from datetime import datetime
+from typing import Optional
 
-from .config import load_config
+from .config import Config, load_config
 from .gmail_client import GmailClient
 from .rss_fetcher import fetch_rss_articles
 from .summarizer import summarize_newsletters, format_summary_email
@@ -14,6 +15,23 @@ from .summarizer import summarize_newsletters, format_summary_email
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+_GMAIL: Optional[GmailClient] = None
+_GMAIL_CREDENTIALS: Optional[dict] = None
+
+
+def _get_gmail_client(config: Config) -> GmailClient:
+    """
+    Build the Gmail client (and its discovery service) once per container.
+
+    The client is rebuilt when the config's Gmail credentials change, so
+    rotated secrets take effect once the config cache refreshes.
+    """
+    global _GMAIL, _GMAIL_CREDENTIALS
+    if _GMAIL is None or config.gmail_credentials != _GMAIL_CREDENTIALS:
+        _GMAIL = GmailClient(config.gmail_credentials)
+        _GMAIL_CREDENTIALS = config.gmail_credentials
+    return _GMAIL
+
 
 def lambda_handler(event: dict, context) -> dict:
     """
@@ -29,6 +47,9 @@ def lambda_handler(event: dict, context) -> dict:
     logger.info("Starting newsletter summarization")
     logger.info(f"Event: {json.dumps(event)}")
 
+    # One clock read per invocation, shared by the email body and subject
+    now = datetime.now()
+
     try:
         # Load configuration
         use_local = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
@@ -36,7 +57,7 @@ def lambda_handler(event: dict, context) -> dict:
 
         # Fetch emails from Gmail
         logger.info(f"Fetching emails from {len(config.gmail_senders)} senders")
-        gmail_client = GmailClient(config.gmail_credentials)
+        gmail_client = _get_gmail_client(config)
         emails = gmail_client.fetch_emails_from_senders(
             senders=config.gmail_senders,
             hours_back=24,
@@ -84,10 +105,10 @@ def lambda_handler(event: dict, context) -> dict:
             summary=summary,
             email_count=len(emails),
             article_count=len(articles),
+            today=now.strftime("%A, %B %d, %Y"),
         )
 
-        today = datetime.now().strftime("%B %d, %Y")
-        subject = f"📬 Daily Newsletter Digest - {today}"
+        subject = f"📬 Daily Newsletter Digest - {now.strftime('%B %d, %Y')}"
 
         success = gmail_client.send_email(
             to=config.destination_email,
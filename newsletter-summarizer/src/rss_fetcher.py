@@ -1,23 +1,42 @@
 """RSS feed fetcher for Substack newsletters."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Optional
 from time import mktime
 
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 
+logger = logging.getLogger(__name__)
 
-def parse_published_date(entry: dict) -> Optional[datetime]:
-    """Parse the published date from an RSS entry."""
-    # Try published_parsed first
-    if hasattr(entry, "published_parsed") and entry.published_parsed:
-        return datetime.fromtimestamp(mktime(entry.published_parsed), tz=timezone.utc)
+# One session per container so keep-alive connections are reused across
+# feeds on the same host (Substack serves many feeds from shared hosts)
+_HTTP = requests.Session()
+_HTTP.headers["User-Agent"] = "NewsletterSummarizer/1.0"
+_HTTP.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Conditional GET validators and the parsed feed, per feed URL, kept for the
+# life of the container. An unchanged feed answers 304 and is not re-parsed;
+# its cached entries are still filtered against the current time window.
+_FEED_CACHE: dict[str, tuple[dict, feedparser.FeedParserDict]] = {}
+
+
+def parse_published_timestamp(entry: dict) -> Optional[float]:
+    """Parse the published (or else updated) time of an RSS entry as a timestamp."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    return mktime(parsed) if parsed else None
 
-    # Try updated_parsed
-    if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-        return datetime.fromtimestamp(mktime(entry.updated_parsed), tz=timezone.utc)
 
-    return None
+def parse_published_date(entry: dict) -> Optional[datetime]:
+    """Parse the published date from an RSS entry."""
+    timestamp = parse_published_timestamp(entry)
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
 
 def fetch_rss_articles(
@@ -28,6 +47,8 @@ def fetch_rss_articles(
     """
     Fetch articles from RSS feeds published within the time window.
 
+    Feeds are fetched concurrently, since each fetch is network-bound.
+
     Args:
         feed_urls: List of RSS feed URLs.
         hours_back: How many hours back to look for articles.
@@ -36,57 +57,86 @@ def fetch_rss_articles(
     Returns:
         List of article dictionaries with 'title', 'author', 'date', 'content', 'link'.
     """
+    if not feed_urls:
+        return []
+
+    cutoff = (datetime.now(tz=timezone.utc) - timedelta(hours=hours_back)).timestamp()
+    fetch_one = partial(_fetch_feed, cutoff=cutoff, timeout=timeout)
+
     articles = []
-    cutoff_time = datetime.now(tz=timezone.utc) - timedelta(hours=hours_back)
+    with ThreadPoolExecutor(max_workers=min(16, len(feed_urls))) as executor:
+        # map keeps results in feed order
+        for feed_articles in executor.map(fetch_one, feed_urls):
+            articles.extend(feed_articles)
 
-    for feed_url in feed_urls:
-        try:
-            feed = feedparser.parse(feed_url, request_headers={
-                "User-Agent": "NewsletterSummarizer/1.0"
-            })
+    return articles
+
+
+def _fetch_feed(feed_url: str, cutoff: float, timeout: int) -> list[dict]:
+    """Fetch one feed, returning its articles published after the cutoff timestamp."""
+    articles = []
+
+    try:
+        cached = _FEED_CACHE.get(feed_url)
+        response = _HTTP.get(
+            feed_url,
+            headers=cached[0] if cached else None,
+            timeout=timeout,
+        )
+
+        if cached and response.status_code == 304:
+            feed = cached[1]
+        else:
+            response.raise_for_status()
+
+            # feedparser reads the content type (for encoding) from lowercase keys
+            headers = {name.lower(): value for name, value in response.headers.items()}
+            feed = feedparser.parse(response.content, response_headers=headers)
 
             if feed.bozo and not feed.entries:
-                print(f"Error parsing feed {feed_url}: {feed.bozo_exception}")
+                logger.warning("Error parsing feed %s: %s", feed_url, feed.bozo_exception)
+                return []
+
+            validators = {}
+            if "etag" in headers:
+                validators["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                validators["If-Modified-Since"] = headers["last-modified"]
+            if validators:
+                _FEED_CACHE[feed_url] = (validators, feed)
+
+        feed_title = feed.feed.get("title", "Unknown Feed")
+
+        for entry in feed.entries:
+            # Compare raw timestamps so old entries never build a datetime
+            published = parse_published_timestamp(entry)
+
+            if published is None:
+                # If no date, include it (assume recent)
+                date = ""
+            elif published < cutoff:
+                # Skip old articles
                 continue
+            else:
+                date = datetime.fromtimestamp(published, tz=timezone.utc).isoformat()
+
+            # Extract content: content:encoded first (full content), then
+            # summary, then description
+            content = ""
+            if entry.get("content"):
+                content = entry.content[0].get("value", "")
+            content = content or entry.get("summary") or entry.get("description") or ""
+
+            articles.append({
+                "title": entry.get("title", "Untitled"),
+                "author": entry.get("author", feed_title),
+                "date": date,
+                "content": content,
+                "link": entry.get("link", ""),
+                "feed": feed_title,
+            })
 
-            feed_title = feed.feed.get("title", "Unknown Feed")
-
-            for entry in feed.entries:
-                published = parse_published_date(entry)
-
-                if published is None:
-                    # If no date, include it (assume recent)
-                    pass
-                elif published < cutoff_time:
-                    # Skip old articles
-                    continue
-
-                # Extract content
-                content = ""
-
-                # Try content:encoded first (full content)
-                if hasattr(entry, "content") and entry.content:
-                    content = entry.content[0].get("value", "")
-
-                # Fall back to summary
-                if not content and hasattr(entry, "summary"):
-                    content = entry.summary
-
-                # Fall back to description
-                if not content and hasattr(entry, "description"):
-                    content = entry.description
-
-                articles.append({
-                    "title": entry.get("title", "Untitled"),
-                    "author": entry.get("author", feed_title),
-                    "date": published.isoformat() if published else "",
-                    "content": content,
-                    "link": entry.get("link", ""),
-                    "feed": feed_title,
-                })
-
-        except Exception as e:
-            print(f"Error fetching feed {feed_url}: {e}")
-            continue
+    except Exception as e:
+        logger.warning("Error fetching feed %s: %s", feed_url, e)
 
     return articles
@@ -1,24 +1,122 @@
 """Claude API summarization for newsletter content."""
 
+import io
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import anthropic
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+logger = logging.getLogger(__name__)
+
+# Whitespace runs are collapsed in C: to one newline if they contain a line
+# break, otherwise to a single space
+_SPACES = re.compile(r"[^\S\n]+")
+_BLOCK_ELEMENTS = "p, div, li, br, h1, h2, h3, h4, h5, h6, tr"
+_LINE_BREAKS = re.compile(r"\s*\n\s*")
+
+# Per-email/article text cap, and how much raw HTML is parsed to fill it
+# (markup usually outweighs text well under 4x)
+_MAX_ITEM_CHARS = 10000
+_MAX_ITEM_HTML_CHARS = 4 * _MAX_ITEM_CHARS
+
+
+# Digest email skeleton, built once at import; CSS braces are doubled for format()
+_EMAIL_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }}
+        h1 {{
+            color: #1a1a2e;
+            border-bottom: 2px solid #4a4e69;
+            padding-bottom: 10px;
+        }}
+        h2 {{
+            color: #4a4e69;
+            margin-top: 30px;
+        }}
+        h3 {{
+            color: #22223b;
+            margin-top: 20px;
+        }}
+        ul {{
+            padding-left: 20px;
+        }}
+        li {{
+            margin-bottom: 8px;
+        }}
+        a {{
+            color: #4a4e69;
+        }}
+        .meta {{
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 20px;
+        }}
+        .footer {{
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            font-size: 0.85em;
+            color: #666;
+        }}
+    </style>
+</head>
+<body>
+    <h1>📬 Daily Newsletter Digest</h1>
+    <p class="meta">{today} • {email_count} emails, {article_count} articles</p>
+
+    {summary}
+
+    <div class="footer">
+        <p>This digest was automatically generated by Newsletter Summarizer using Claude AI.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Get an Anthropic client, reused across warm invocations.
+
+    Reusing the client keeps its HTTP connection pool, so later calls skip
+    the TCP and TLS handshake.
+    """
+    return anthropic.Anthropic(api_key=api_key)
 
 
 def clean_html_content(html: str) -> str:
     """Strip HTML tags and clean up content for summarization."""
-    soup = BeautifulSoup(html, "html.parser")
+    body = LexborHTMLParser(html).body
+    if body is None:
+        return ""
 
     # Remove script and style elements
-    for element in soup(["script", "style"]):
+    for element in body.css("script, style"):
         element.decompose()
 
-    text = soup.get_text(separator="\n")
+    # Block elements start a new line, so minified markup keeps its structure
+    for element in body.css(_BLOCK_ELEMENTS):
+        element.insert_before("\n")
+        element.insert_after("\n")
 
-    # Clean up whitespace
-    lines = [line.strip() for line in text.splitlines()]
-    return "\n".join(line for line in lines if line)
+    # A space separator keeps inline tags (<strong>, <a>) within their line
+    text = _SPACES.sub(" ", body.text(separator=" "))
+    return _LINE_BREAKS.sub("\n", text).strip()
 
 
 def prepare_content_for_summarization(
@@ -37,47 +135,50 @@ def prepare_content_for_summarization(
     Returns:
         Formatted string of all newsletter content.
     """
-    sections = []
-    total_chars = 0
+    # One growing buffer; its position doubles as the running length
+    buf = io.StringIO()
 
     # Add emails
     for email in emails:
-        if total_chars >= max_chars:
+        if buf.tell() >= max_chars:
             break
 
-        section = f"""
----
-EMAIL FROM: {email['from']}
-SUBJECT: {email['subject']}
-DATE: {email['date']}
-
-{email['body'][:10000]}
----
-"""
-        sections.append(section)
-        total_chars += len(section)
+        if buf.tell():
+            buf.write("\n")
+        buf.write("\n---\nEMAIL FROM: ")
+        buf.write(email['from'])
+        buf.write("\nSUBJECT: ")
+        buf.write(email['subject'])
+        buf.write("\nDATE: ")
+        buf.write(email['date'])
+        buf.write("\n\n")
+        buf.write(email['body'][:_MAX_ITEM_CHARS])
+        buf.write("\n---\n")
 
     # Add RSS articles
     for article in rss_articles:
-        if total_chars >= max_chars:
+        if buf.tell() >= max_chars:
             break
 
-        content = clean_html_content(article['content'])[:10000]
+        # Only parse as much HTML as can fill the per-article cap
+        raw_html = article['content'][:_MAX_ITEM_HTML_CHARS]
+        content = clean_html_content(raw_html)[:_MAX_ITEM_CHARS]
 
-        section = f"""
----
-ARTICLE: {article['title']}
-FROM: {article['author']} ({article['feed']})
-DATE: {article['date']}
-LINK: {article['link']}
+        if buf.tell():
+            buf.write("\n")
+        buf.write("\n---\nARTICLE: ")
+        buf.write(article['title'])
+        buf.write("\nFROM: ")
+        buf.write(f"{article['author']} ({article['feed']})")
+        buf.write("\nDATE: ")
+        buf.write(article['date'])
+        buf.write("\nLINK: ")
+        buf.write(article['link'])
+        buf.write("\n\n")
+        buf.write(content)
+        buf.write("\n---\n")
 
-{content}
----
-"""
-        sections.append(section)
-        total_chars += len(section)
-
-    return "\n".join(sections)
+    return buf.getvalue()
 
 
 def summarize_newsletters(
@@ -133,7 +234,7 @@ Here is the content to summarize:
 {content}
 """
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client(api_key)
 
     try:
         response = client.messages.create(
@@ -153,7 +254,7 @@ Here is the content to summarize:
         return summary
 
     except Exception as e:
-        print(f"Error calling Claude API: {e}")
+        logger.warning("Error calling Claude API: %s", e)
         return None
 
 
@@ -161,6 +262,7 @@ def format_summary_email(
     summary: str,
     email_count: int,
     article_count: int,
+    today: Optional[str] = None,
 ) -> str:
     """
     Format the summary as a complete HTML email.
@@ -169,72 +271,17 @@ def format_summary_email(
         summary: HTML summary content.
         email_count: Number of emails summarized.
         article_count: Number of RSS articles summarized.
+        today: Formatted date for the header. Defaults to the current date.
 
     Returns:
         Complete HTML email body.
     """
-    from datetime import datetime
-
-    today = datetime.now().strftime("%A, %B %d, %Y")
-
-    return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        h1 {{
-            color: #1a1a2e;
-            border-bottom: 2px solid #4a4e69;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #4a4e69;
-            margin-top: 30px;
-        }}
-        h3 {{
-            color: #22223b;
-            margin-top: 20px;
-        }}
-        ul {{
-            padding-left: 20px;
-        }}
-        li {{
-            margin-bottom: 8px;
-        }}
-        a {{
-            color: #4a4e69;
-        }}
-        .meta {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 20px;
-        }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            font-size: 0.85em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <h1>📬 Daily Newsletter Digest</h1>
-    <p class="meta">{today} • {email_count} emails, {article_count} articles</p>
-
-    {summary}
-
-    <div class="footer">
-        <p>This digest was automatically generated by Newsletter Summarizer using Claude AI.</p>
-    </div>
-</body>
-</html>
-"""
+    if today is None:
+        today = datetime.now().strftime("%A, %B %d, %Y")
+
+    return _EMAIL_TEMPLATE.format(
+        summary=summary,
+        today=today,
+        email_count=email_count,
+        article_count=article_count,
+    )
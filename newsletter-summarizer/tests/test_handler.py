@@ -30,6 +30,12 @@ class TestRssFetcher:
         assert "alert" not in result
         assert "<script>" not in result
 
+    def test_clean_html_content_breaks_minified_blocks(self):
+        """Block elements become lines even without whitespace between tags."""
+        html = "<p>One</p><p>Two <em>more</em></p><ul><li>a</li><li>b</li></ul>"
+
+        assert clean_html_content(html) == "One\nTwo more\na\nb"
+
     def test_prepare_content_for_summarization(self):
         """Test content preparation for Claude."""
         emails = [
@@ -74,6 +80,32 @@ class TestRssFetcher:
 
         assert len(result) < 10000  # Should be limited
 
+    def test_fetch_rss_reuses_unchanged_feed(self):
+        """Test that a 304 response reuses the cached feed."""
+        from src import rss_fetcher
+
+        feed_xml = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Test Feed</title>
+        <item><title>Undated</title><description>Body</description></item>
+        </channel></rss>"""
+
+        fresh = MagicMock(
+            status_code=200,
+            content=feed_xml,
+            headers={"Content-Type": "application/rss+xml", "ETag": '"v1"'},
+        )
+        unchanged = MagicMock(status_code=304, headers={})
+
+        with patch.dict(rss_fetcher._FEED_CACHE, clear=True), \
+             patch.object(rss_fetcher._HTTP, "get", side_effect=[fresh, unchanged]) as mock_get:
+
+            first = fetch_rss_articles(["https://test.com/feed"])
+            second = fetch_rss_articles(["https://test.com/feed"])
+
+        assert [a["title"] for a in first] == ["Undated"]
+        assert second == first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
 
 class TestSummarizer:
     """Tests for summarization functionality."""
@@ -81,7 +113,9 @@ class TestSummarizer:
     @patch("src.summarizer.anthropic.Anthropic")
     def test_summarize_newsletters(self, mock_anthropic):
         """Test Claude API summarization."""
-        from src.summarizer import summarize_newsletters
+        from src.summarizer import _get_client, summarize_newsletters
+
+        _get_client.cache_clear()
 
         # Mock the API response
         mock_response = MagicMock()
@@ -104,9 +138,69 @@ class TestSummarizer:
         assert result is None
 
 
+class TestGmailClient:
+    """Tests for Gmail fetching."""
+
+    def test_fetch_emails_batches_message_gets(self):
+        """Test that messages are fetched in one batch request."""
+        import base64
+        from src.gmail_client import GmailClient
+
+        client = GmailClient.__new__(GmailClient)
+        client.service = MagicMock()
+        client.service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "a"}, {"id": "b"}],
+        }
+
+        def _message(subject):
+            return {
+                "payload": {
+                    "headers": [{"name": "Subject", "value": subject}],
+                    "body": {"data": base64.urlsafe_b64encode(b"Body").decode()},
+                },
+            }
+
+        batch = MagicMock()
+
+        def _new_batch(callback):
+            batch.execute.side_effect = lambda: [
+                callback(call.kwargs["request_id"], _message(call.kwargs["request_id"]), None)
+                for call in batch.add.call_args_list
+            ]
+            return batch
+
+        client.service.new_batch_http_request.side_effect = _new_batch
+
+        emails = client.fetch_emails_from_senders(["test@test.com"])
+
+        assert [email["subject"] for email in emails] == ["a", "b"]
+        batch.execute.assert_called_once()
+
+
 class TestIntegration:
     """Integration tests (require mocking external services)."""
 
+    @pytest.fixture(autouse=True)
+    def reset_gmail_client(self):
+        """Don't let a cached Gmail client leak between tests."""
+        with patch("src.handler._GMAIL", None), \
+             patch("src.handler._GMAIL_CREDENTIALS", None):
+            yield
+
+    def test_gmail_client_rebuilt_on_rotated_credentials(self):
+        from src import handler
+
+        old = MagicMock(gmail_credentials={"refresh_token": "old"})
+        new = MagicMock(gmail_credentials={"refresh_token": "new"})
+
+        with patch.object(handler, "GmailClient") as mock_gmail:
+            handler._get_gmail_client(old)
+            handler._get_gmail_client(old)
+            handler._get_gmail_client(new)
+
+        assert mock_gmail.call_count == 2
+        mock_gmail.assert_called_with({"refresh_token": "new"})
+
     @patch("src.handler.GmailClient")
     @patch("src.handler.fetch_rss_articles")
     @patch("src.handler.summarize_newsletters")
@@ -1,17 +1,55 @@
 """Flask application for YouTube Transcript Summarizer."""
 
 import re
+import threading
 from dotenv import load_dotenv
 load_dotenv()
 
-from flask import Flask, render_template, request, jsonify
+import orjson
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from transcript_client import fetch_transcript
-from summarizer import summarize_transcript
+from transcript_client import (
+    TranscriptError,
+    extract_video_id,
+    fetch_transcript_by_id,
+    is_transcript_cached,
+)
+from summarizer import (
+    SummaryError,
+    require_api_key,
+    summarize_transcript,
+    summarize_transcript_stream,
+    warm_up_client,
+)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson.
+
+    Transcripts run to ~100KB of text, which orjson serializes several
+    times faster than the stdlib encoder. Types orjson doesn't know fall
+    back to Flask's default handling (dates, UUIDs, dataclasses, ...).
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Request bodies are a single URL; larger ones are rejected before parsing
+app.config["MAX_CONTENT_LENGTH"] = 4096
 CORS(app)  # Enable CORS for Chrome extension
 
+_VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+# Longest a request waits on the Anthropic warm-up once its transcript is in
+_WARM_UP_JOIN_TIMEOUT = 1.0
+
 
 @app.after_request
 def add_security_headers(response):
@@ -52,7 +90,91 @@ def validate_video_id(video_id):
     """Validate YouTube video ID format (11 alphanumeric chars + dash + underscore)."""
     if not video_id:
         return False
-    return bool(re.match(r'^[a-zA-Z0-9_-]{11}$', video_id))
+    return _VIDEO_ID_RE.match(video_id) is not None
+
+
+def _validated_video_id(data):
+    """Validate a request body's URL and extract its video ID.
+
+    Returns:
+        (video_id, None) if the URL holds a well-formed video ID, otherwise
+        (None, error_response) with a 400 JSON response to return.
+    """
+    if not data or "url" not in data:
+        return None, _bad_request("Missing 'url' in request body.")
+
+    url = data["url"]
+
+    if not isinstance(url, str):
+        return None, _bad_request("URL must be a string.")
+
+    # Basic URL validation - reject obviously malicious patterns. Checked
+    # before strip() so an oversized value is never copied.
+    if len(url) > 500:
+        return None, _bad_request("URL too long.")
+
+    url = url.strip()
+
+    if not url:
+        return None, _bad_request("URL cannot be empty.")
+
+    # Reject URLs without a well-formed video ID before any network call
+    video_id = extract_video_id(url)
+    if not validate_video_id(video_id):
+        return None, _bad_request(
+            "Could not extract video ID from URL. Please provide a valid YouTube URL."
+        )
+
+    return video_id, None
+
+
+def _bad_request(message):
+    """Build a 400 JSON error response."""
+    return jsonify({
+        "success": False,
+        "error": message
+    }), 400
+
+
+def _transcript_error_response(error):
+    """Build the JSON error response for a failed transcript fetch."""
+    return jsonify({
+        "success": False,
+        "video_id": error.video_id,
+        "error": error.message
+    }), error.status_code
+
+
+def _fetch_transcript_warming_client(video_id):
+    """Fetch a transcript, connecting to Anthropic meanwhile on a cache miss.
+
+    The TLS handshake then overlaps the YouTube round trip instead of
+    delaying the summary request. Under the gevent worker the thread is a
+    greenlet. Cached transcripts return at once, so nothing is warmed.
+    """
+    if is_transcript_cached(video_id):
+        return fetch_transcript_by_id(video_id)
+
+    warm_up = threading.Thread(target=warm_up_client, daemon=True)
+    warm_up.start()
+    try:
+        return fetch_transcript_by_id(video_id)
+    finally:
+        warm_up.join(_WARM_UP_JOIN_TIMEOUT)
+
+
+def _sse(payload):
+    """Format a payload as a Server-Sent Events data frame."""
+    return f"data: {orjson.dumps(payload).decode('utf-8')}\n\n"
+
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Return oversized request rejections as JSON like other API errors."""
+    return jsonify({
+        "success": False,
+        "error": "Request body too large."
+    }), 413
 
 
 @app.route("/")
@@ -75,59 +197,80 @@ def summarize():
         - summary: str (if successful)
         - error: str (if failed)
     """
-    data = request.get_json()
-
-    if not data or "url" not in data:
+    video_id, error = _validated_video_id(request.get_json())
+    if error is not None:
+        return error
+
+    try:
+        transcript = _fetch_transcript_warming_client(video_id)
+        summary = summarize_transcript(transcript)
+    except TranscriptError as e:
+        return _transcript_error_response(e)
+    except SummaryError as e:
         return jsonify({
             "success": False,
-            "error": "Missing 'url' in request body."
-        }), 400
-
-    url = data["url"].strip()
-
-    if not url:
-        return jsonify({
-            "success": False,
-            "error": "URL cannot be empty."
-        }), 400
-
-    # Basic URL validation - reject obviously malicious patterns
-    if len(url) > 500:
-        return jsonify({
-            "success": False,
-            "error": "URL too long."
-        }), 400
+            "video_id": video_id,
+            "error": str(e)
+        }), 500
 
-    # Fetch transcript
-    transcript_result = fetch_transcript(url)
+    return jsonify({
+        "success": True,
+        "video_id": video_id,
+        "transcript": transcript,
+        "summary": summary
+    })
 
-    if not transcript_result["success"]:
-        return jsonify(transcript_result), 400
 
-    # Validate video ID format
-    video_id = transcript_result.get("video_id", "")
-    if not validate_video_id(video_id):
-        return jsonify({
-            "success": False,
-            "error": "Invalid video ID."
-        }), 400
+@app.route("/summarize_stream", methods=["POST"])
+def summarize_stream():
+    """Summarize a YouTube video transcript as a Server-Sent Events stream.
 
-    # Summarize transcript
-    summary_result = summarize_transcript(transcript_result["transcript"])
+    Expects JSON body with:
+        - url: YouTube video URL
 
-    if not summary_result["success"]:
+    Errors before summarization starts are returned as JSON, like /summarize.
+    Otherwise streams text/event-stream frames whose data is JSON with:
+        - video_id, transcript: sent first
+        - chunk: str, a piece of the summary as Claude writes it
+        - error: str, if summarization failed part way
+        - done: true, once the summary is complete
+    """
+    video_id, error = _validated_video_id(request.get_json())
+    if error is not None:
+        return error
+
+    # Configuration errors can't be reported once the stream has started
+    try:
+        require_api_key()
+    except SummaryError as e:
         return jsonify({
             "success": False,
             "video_id": video_id,
-            "error": summary_result["error"]
+            "error": str(e)
         }), 500
 
-    return jsonify({
-        "success": True,
-        "video_id": video_id,
-        "transcript": transcript_result["transcript"],
-        "summary": summary_result["summary"]
-    })
+    # Fetch transcript
+    try:
+        transcript = _fetch_transcript_warming_client(video_id)
+    except TranscriptError as e:
+        return _transcript_error_response(e)
+
+    def generate():
+        yield _sse({"video_id": video_id, "transcript": transcript})
+        try:
+            for chunk in summarize_transcript_stream(transcript):
+                yield _sse({"chunk": chunk})
+        except Exception as e:
+            yield _sse({"error": f"Failed to generate summary: {str(e)}"})
+            return
+        yield _sse({"done": True})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        # Keep proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/transcript", methods=["POST"])
@@ -143,47 +286,20 @@ def get_transcript():
         - transcript: str (if successful)
         - error: str (if failed)
     """
-    data = request.get_json()
-
-    if not data or "url" not in data:
-        return jsonify({
-            "success": False,
-            "error": "Missing 'url' in request body."
-        }), 400
-
-    url = data["url"].strip()
-
-    if not url:
-        return jsonify({
-            "success": False,
-            "error": "URL cannot be empty."
-        }), 400
-
-    # Basic URL validation
-    if len(url) > 500:
-        return jsonify({
-            "success": False,
-            "error": "URL too long."
-        }), 400
+    video_id, error = _validated_video_id(request.get_json())
+    if error is not None:
+        return error
 
     # Fetch transcript only
-    transcript_result = fetch_transcript(url)
-
-    if not transcript_result["success"]:
-        return jsonify(transcript_result), 400
-
-    # Validate video ID format
-    video_id = transcript_result.get("video_id", "")
-    if not validate_video_id(video_id):
-        return jsonify({
-            "success": False,
-            "error": "Invalid video ID."
-        }), 400
+    try:
+        transcript = fetch_transcript_by_id(video_id)
+    except TranscriptError as e:
+        return _transcript_error_response(e)
 
     return jsonify({
         "success": True,
         "video_id": video_id,
-        "transcript": transcript_result["transcript"]
+        "transcript": transcript
     })
 
 
@@ -1,10 +1,22 @@
 """Claude API summarization for YouTube transcripts."""
 
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterator, Optional
 from anthropic import Anthropic
 
-# Maximum transcript size (100KB like newsletter-summarizer)
-MAX_TRANSCRIPT_SIZE = 100 * 1024
+# Transcript budget in tokens, leaving room for the prompt and the summary
+# in the model's 200k context window
+MAX_TRANSCRIPT_TOKENS = 150_000
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 2048
+
+# Read once at import; app.py loads .env before importing this module
+_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 
 SUMMARY_PROMPT = """Summarize this YouTube video transcript. Extract:
 
@@ -22,36 +34,144 @@ Here's the transcript:
 
 {transcript}"""
 
+# Summaries of recent transcripts keyed by the SHA-256 of the transcript,
+# least recently used first. Only successful summaries are stored.
+_SUMMARY_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SUMMARY_CACHE_SIZE = 256
+
+# Token counts of recent long transcripts, keyed like the summary cache so
+# only digests, not transcripts, are held
+_TOKEN_COUNTS: "OrderedDict[str, int]" = OrderedDict()
+_TOKEN_COUNTS_SIZE = 256
+
+# Guards both caches: under a threaded server an eviction could otherwise
+# land between get() and move_to_end() and raise KeyError
+_CACHE_LOCK = threading.Lock()
+
+
+class SummaryError(Exception):
+    """Raised when a summary cannot be generated."""
+
+
+def require_api_key() -> None:
+    """Raise SummaryError if ANTHROPIC_API_KEY is not set."""
+    if not _API_KEY:
+        raise SummaryError("ANTHROPIC_API_KEY environment variable not set.")
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> Anthropic:
+    """Get an Anthropic client, reused across requests to keep its connection pool."""
+    return Anthropic(api_key=api_key)
+
+
+def warm_up_client() -> None:
+    """Open the Anthropic client's pooled HTTPS connection ahead of a summary.
+
+    Meant to run alongside a transcript fetch from YouTube. Failures are
+    ignored; the summary request connects and reports errors itself.
+    """
+    if not _API_KEY:
+        return
+
+    try:
+        # Listing one model is free and goes through the same connection pool
+        _get_client(_API_KEY).models.list(limit=1)
+    except Exception:
+        pass
+
+
+def _cache_key(transcript: str) -> str:
+    """Compute the summary cache key for a transcript."""
+    return hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+
+
+def _count_tokens(cache_key: str, transcript: str) -> int:
+    """Count a transcript's tokens with the token counting endpoint.
+
+    Counts are remembered by the transcript's cache key.
+    """
+    with _CACHE_LOCK:
+        tokens = _TOKEN_COUNTS.get(cache_key)
+        if tokens is not None:
+            _TOKEN_COUNTS.move_to_end(cache_key)
+            return tokens
+
+    tokens = _get_client(_API_KEY).messages.count_tokens(
+        model=MODEL,
+        messages=[{"role": "user", "content": transcript}],
+    ).input_tokens
+
+    with _CACHE_LOCK:
+        _TOKEN_COUNTS[cache_key] = tokens
+        if len(_TOKEN_COUNTS) > _TOKEN_COUNTS_SIZE:
+            _TOKEN_COUNTS.popitem(last=False)
+
+    return tokens
+
 
-def summarize_transcript(transcript: str) -> dict:
+def _truncate_transcript(transcript: str, cache_key: str) -> str:
+    """Truncate a transcript to MAX_TRANSCRIPT_TOKENS."""
+    # A token never covers less than one UTF-8 byte, so transcripts this
+    # short fit without a round trip to count them
+    if len(transcript.encode("utf-8")) <= MAX_TRANSCRIPT_TOKENS:
+        return transcript
+
+    tokens = _count_tokens(cache_key, transcript)
+    if tokens <= MAX_TRANSCRIPT_TOKENS:
+        return transcript
+
+    # Keep the share of characters that fits the budget
+    keep = len(transcript) * MAX_TRANSCRIPT_TOKENS // tokens
+    return transcript[:keep] + "\n\n[Transcript truncated due to length...]"
+
+
+def _get_cached_summary(cache_key: str) -> Optional[str]:
+    """Return a cached summary, marking it recently used, or None."""
+    with _CACHE_LOCK:
+        summary = _SUMMARY_CACHE.get(cache_key)
+        if summary is not None:
+            _SUMMARY_CACHE.move_to_end(cache_key)
+        return summary
+
+
+def _cache_summary(cache_key: str, summary: str) -> None:
+    """Store a summary, evicting the least recently used one when full."""
+    with _CACHE_LOCK:
+        _SUMMARY_CACHE[cache_key] = summary
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+
+
+def summarize_transcript(transcript: str) -> str:
     """Summarize a YouTube transcript using Claude API.
 
     Args:
         transcript: The full transcript text
 
     Returns:
-        dict with keys:
-            - success: bool
-            - summary: str (if successful)
-            - error: str (if failed)
+        The summary text
+
+    Raises:
+        SummaryError: If the API key is missing or the Claude request fails
     """
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        return {
-            "success": False,
-            "error": "ANTHROPIC_API_KEY environment variable not set."
-        }
+    require_api_key()
+
+    cache_key = _cache_key(transcript)
 
-    # Truncate transcript if too long
-    if len(transcript) > MAX_TRANSCRIPT_SIZE:
-        transcript = transcript[:MAX_TRANSCRIPT_SIZE] + "\n\n[Transcript truncated due to length...]"
+    cached = _get_cached_summary(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        client = Anthropic(api_key=api_key)
+        # Truncate transcript if too long
+        transcript = _truncate_transcript(transcript, cache_key)
+
+        client = _get_client(_API_KEY)
 
         message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
             messages=[
                 {
                     "role": "user",
@@ -59,23 +179,62 @@ def summarize_transcript(transcript: str) -> dict:
                 }
             ]
         )
+    except Exception as e:
+        raise SummaryError(f"Failed to generate summary: {str(e)}") from e
 
-        summary = message.content[0].text
+    summary = message.content[0].text
+    _cache_summary(cache_key, summary)
+    return summary
 
-        return {
-            "success": True,
-            "summary": summary
-        }
 
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Failed to generate summary: {str(e)}"
-        }
+def summarize_transcript_stream(transcript: str) -> Iterator[str]:
+    """Summarize a YouTube transcript, yielding text as Claude generates it.
+
+    Args:
+        transcript: The full transcript text
+
+    Yields:
+        Pieces of the summary in order. A cached summary is yielded whole.
+
+    Raises:
+        SummaryError: If ANTHROPIC_API_KEY is not set.
+        anthropic.APIError: If the Claude request fails.
+    """
+    require_api_key()
+
+    cache_key = _cache_key(transcript)
+
+    cached = _get_cached_summary(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    transcript = _truncate_transcript(transcript, cache_key)
+    client = _get_client(_API_KEY)
+
+    parts = []
+    with client.messages.stream(
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        messages=[
+            {
+                "role": "user",
+                "content": SUMMARY_PROMPT.format(transcript=transcript)
+            }
+        ]
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            yield text
+
+    # Only a summary that streamed to completion is cached
+    _cache_summary(cache_key, "".join(parts))
 
 
 if __name__ == "__main__":
     # Quick test
     test_transcript = "This is a test transcript about technology and startups."
-    result = summarize_transcript(test_transcript)
-    print(result)
+    try:
+        print(summarize_transcript(test_transcript))
+    except SummaryError as e:
+        print(f"Error: {e}")
@@ -2,6 +2,10 @@
 
 import os
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import WebshareProxyConfig
@@ -11,6 +15,39 @@ from youtube_transcript_api._errors import (
     VideoUnavailable,
 )
 
+# Compiled once at import rather than looked up in re's cache per request.
+# Group 1 captures an ID from a URL, group 2 a bare video ID.
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/(?:embed|v)/)([a-zA-Z0-9_-]{11})'
+    r'|^([a-zA-Z0-9_-]{11})$'
+)
+
+# Transcript text of recently fetched videos, least recently used first.
+# Only successful fetches are stored so failures are retried next time.
+_TRANSCRIPT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_TRANSCRIPT_CACHE_SIZE = 512
+# Threaded servers share the cache; the lock keeps a lookup from racing an
+# eviction between get() and move_to_end()
+_TRANSCRIPT_CACHE_LOCK = threading.Lock()
+
+_get_text = attrgetter("text")
+
+
+class TranscriptError(Exception):
+    """Raised when a transcript cannot be fetched.
+
+    Attributes:
+        message: User-facing error message
+        video_id: The video ID, if one was extracted
+        status_code: HTTP status to respond with
+    """
+
+    def __init__(self, message: str, video_id: Optional[str] = None, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.video_id = video_id
+        self.status_code = status_code
+
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from various URL formats.
@@ -22,21 +59,20 @@ def extract_video_id(url: str) -> Optional[str]:
     - https://www.youtube.com/v/VIDEO_ID
     - Just the video ID itself
     """
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})',
-        r'^([a-zA-Z0-9_-]{11})$',  # Just the video ID
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
 
     return None
 
 
+@lru_cache(maxsize=1)
 def get_youtube_api():
-    """Create YouTubeTranscriptApi instance with proxy if configured."""
+    """Create YouTubeTranscriptApi instance with proxy if configured.
+
+    Built once per process so its HTTP session, and the connections it
+    pools, are reused across requests.
+    """
     proxy_username = os.environ.get("WEBSHARE_PROXY_USERNAME")
     proxy_password = os.environ.get("WEBSHARE_PROXY_PASSWORD")
 
@@ -52,27 +88,66 @@ def get_youtube_api():
         return YouTubeTranscriptApi()
 
 
-def fetch_transcript(url: str) -> dict:
+def fetch_transcript(url: str) -> tuple[str, str]:
     """Fetch transcript for a YouTube video.
 
     Args:
         url: YouTube video URL or video ID
 
     Returns:
-        dict with keys:
-            - success: bool
-            - video_id: str (if successful)
-            - transcript: str (if successful)
-            - error: str (if failed)
+        Tuple of (video_id, transcript text)
+
+    Raises:
+        TranscriptError: If no video ID is found or the fetch fails
     """
     video_id = extract_video_id(url)
 
     if not video_id:
-        return {
-            "success": False,
-            "error": "Could not extract video ID from URL. Please provide a valid YouTube URL."
-        }
+        raise TranscriptError(
+            "Could not extract video ID from URL. Please provide a valid YouTube URL."
+        )
+
+    return video_id, fetch_transcript_by_id(video_id)
+
+
+def is_transcript_cached(video_id: str) -> bool:
+    """Whether fetch_transcript_by_id would answer from memory."""
+    return video_id in _TRANSCRIPT_CACHE
+
 
+def fetch_transcript_by_id(video_id: str) -> str:
+    """Fetch transcript text for an already extracted YouTube video ID.
+
+    Recently fetched transcripts are served from memory.
+
+    Args:
+        video_id: 11-character YouTube video ID
+
+    Returns:
+        The transcript text
+
+    Raises:
+        TranscriptError: If the fetch fails
+    """
+    with _TRANSCRIPT_CACHE_LOCK:
+        cached = _TRANSCRIPT_CACHE.get(video_id)
+        if cached is not None:
+            _TRANSCRIPT_CACHE.move_to_end(video_id)
+            return cached
+
+    # Failures raise, so only successful fetches reach the cache
+    full_text = _fetch_from_youtube(video_id)
+
+    with _TRANSCRIPT_CACHE_LOCK:
+        _TRANSCRIPT_CACHE[video_id] = full_text
+        if len(_TRANSCRIPT_CACHE) > _TRANSCRIPT_CACHE_SIZE:
+            _TRANSCRIPT_CACHE.popitem(last=False)
+
+    return full_text
+
+
+def _fetch_from_youtube(video_id: str) -> str:
+    """Fetch transcript text from YouTube, bypassing the cache."""
     try:
         # Create API instance with optional proxy support
         api = get_youtube_api()
@@ -80,14 +155,13 @@ def fetch_transcript(url: str) -> dict:
         # Try to get transcript with language fallbacks
         transcript_list = api.list(video_id)
 
-        # Try to find English transcript first
+        # Try to find English transcript first; find_transcript tries the
+        # codes in order against the already fetched list
         transcript = None
-        for lang in ['en', 'en-US', 'en-GB']:
-            try:
-                transcript = transcript_list.find_transcript([lang])
-                break
-            except NoTranscriptFound:
-                continue
+        try:
+            transcript = transcript_list.find_transcript(['en', 'en-US', 'en-GB'])
+        except NoTranscriptFound:
+            pass
 
         # If no English, try auto-generated
         if transcript is None:
@@ -98,51 +172,33 @@ def fetch_transcript(url: str) -> dict:
 
         # If still nothing, get any available transcript and translate
         if transcript is None:
-            try:
-                transcript = next(iter(transcript_list))
-                if transcript.language_code != 'en':
-                    transcript = transcript.translate('en')
-            except StopIteration:
-                return {
-                    "success": False,
-                    "video_id": video_id,
-                    "error": "No transcripts available for this video."
-                }
+            transcript = next(iter(transcript_list), None)
+            if transcript is None:
+                raise TranscriptError("No transcripts available for this video.", video_id)
+            if transcript.language_code != 'en':
+                transcript = transcript.translate('en')
 
         # Fetch the actual transcript data
         transcript_data = transcript.fetch()
 
-        # Combine all text segments
-        full_text = " ".join(snippet.text for snippet in transcript_data)
-
-        return {
-            "success": True,
-            "video_id": video_id,
-            "transcript": full_text
-        }
+        # Combine all text segments; map with attrgetter reads each
+        # snippet's text in C instead of a generator frame per snippet
+        return " ".join(map(_get_text, transcript_data))
 
+    except TranscriptError:
+        raise
     except TranscriptsDisabled:
-        return {
-            "success": False,
-            "video_id": video_id,
-            "error": "Transcripts are disabled for this video."
-        }
+        raise TranscriptError("Transcripts are disabled for this video.", video_id)
     except VideoUnavailable:
-        return {
-            "success": False,
-            "video_id": video_id,
-            "error": "Video is unavailable. It may be private or deleted."
-        }
+        raise TranscriptError("Video is unavailable. It may be private or deleted.", video_id)
     except Exception as e:
-        return {
-            "success": False,
-            "video_id": video_id,
-            "error": f"Failed to fetch transcript: {str(e)}"
-        }
+        raise TranscriptError(f"Failed to fetch transcript: {str(e)}", video_id)
 
 
 if __name__ == "__main__":
     # Quick test
     test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-    result = fetch_transcript(test_url)
-    print(result)
+    try:
+        print(fetch_transcript(test_url))
+    except TranscriptError as e:
+        print(f"Error: {e.message}")
@@ -0,0 +1,9 @@
+"""WSGI entry point for gunicorn's gevent worker."""
+
+# Patch sockets, ssl and threading before app (and through it requests,
+# httpx and anthropic) is imported, so their blocking I/O yields to
+# other greenlets instead of holding up the worker
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402